@@ -6,8 +6,57 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from oauth_auth import get_authenticated_service
+from playlist_fetcher import execute_batched
 from utils import load_config, setup_logging
 
+
+def fetch_overview(service):
+    """
+    Fetch channel, 'WL' items and user playlists in a single batched HTTP request.
+    
+    Returns:
+        Dict mapping request id to (response, exception)
+    """
+    return execute_batched(service, {
+        'channel': service.channels().list(
+            part='snippet,contentDetails',
+            mine=True
+        ),
+        'wl': service.playlistItems().list(
+            part='snippet,contentDetails',
+            playlistId='WL',
+            maxResults=5
+        ),
+        'playlists': service.playlists().list(
+            part='snippet,contentDetails',
+            mine=True,
+            maxResults=50
+        ),
+    })
+
+
+def fetch_item_totals(service, playlist_ids):
+    """
+    Get totalResults for several playlists with batched HTTP requests.
+    
+    Returns:
+        Dict mapping playlist ID to its item count (playlists that errored are left out)
+    """
+    results = execute_batched(service, {
+        playlist_id: service.playlistItems().list(
+            part='id',
+            playlistId=playlist_id,
+            maxResults=1
+        )
+        for playlist_id in playlist_ids
+    })
+    return {
+        playlist_id: response.get('pageInfo', {}).get('totalResults', 0)
+        for playlist_id, (response, exception) in results.items()
+        if exception is None
+    }
+
+
 def main():
     config = load_config()
     logger = setup_logging(config['log_file'])
@@ -24,10 +73,10 @@ def main():
         logger.info("DIAGNOSTIC: Checking authenticated account...")
         logger.info("=" * 60)
         
-        channels_response = service.channels().list(
-            part='snippet,contentDetails',
-            mine=True
-        ).execute()
+        overview = fetch_overview(service)
+        channels_response, channels_error = overview['channel']
+        if channels_error:
+            raise channels_error
         
         if channels_response.get('items'):
             channel = channels_response['items'][0]
@@ -78,11 +127,9 @@ def main():
             # Also try the "WL" ID
             logger.info(f"\nTrying special 'WL' playlist ID...")
             try:
-                items_response = service.playlistItems().list(
-                    part='snippet,contentDetails',
-                    playlistId='WL',
-                    maxResults=5
-                ).execute()
+                items_response, wl_error = overview['wl']
+                if wl_error:
+                    raise wl_error
                 
                 total = items_response.get('pageInfo', {}).get('totalResults', 0)
                 logger.info(f"'WL' playlist has {total} items")
@@ -99,20 +146,23 @@ def main():
                         logger.info(f"  - {title} (ID: {video_id})")
                         logger.info(f"    Item keys: {list(item.keys())}")
             except Exception as e:
-                logger.error(f"Error accessing 'WL' playlist: {e}")
-                import traceback
-                logger.error(traceback.format_exc())
+                logger.error(f"Error accessing 'WL' playlist: {e}", exc_info=True)
             
             # List user's playlists
             logger.info(f"\nListing user's playlists...")
-            playlists_response = service.playlists().list(
-                part='snippet,contentDetails',
-                mine=True,
-                maxResults=50
-            ).execute()
+            playlists_response, playlists_error = overview['playlists']
+            if playlists_error:
+                raise playlists_error
             
             logger.info(f"Found {len(playlists_response.get('items', []))} playlists:")
-            for playlist in playlists_response.get('items', [])[:20]:
+            shown_playlists = playlists_response.get('items', [])[:20]
+            # Item counts of possible Watch Later playlists, fetched in one batch
+            item_totals = fetch_item_totals(service, [
+                playlist['id'] for playlist in shown_playlists
+                if 'watch' in playlist['snippet'].get('title', '').lower()
+                and 'later' in playlist['snippet'].get('title', '').lower()
+            ])
+            for playlist in shown_playlists:
                 title = playlist['snippet'].get('title', 'Unknown')
                 playlist_id = playlist['id']
                 item_count = playlist['contentDetails'].get('itemCount', 0)
@@ -120,16 +170,8 @@ def main():
                 # Check if this might be Watch Later
                 if 'watch' in title.lower() and 'later' in title.lower():
                     logger.info(f"    *** This might be your Watch Later playlist! ***")
-                    # Try to get items from it
-                    try:
-                        test_items = service.playlistItems().list(
-                            part='snippet',
-                            playlistId=playlist_id,
-                            maxResults=3
-                        ).execute()
-                        logger.info(f"    This playlist has {test_items.get('pageInfo', {}).get('totalResults', 0)} items")
-                    except:
-                        pass
+                    if playlist_id in item_totals:
+                        logger.info(f"    This playlist has {item_totals[playlist_id]} items")
         
         logger.info("=" * 60)
         
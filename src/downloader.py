@@ -4,35 +4,61 @@ import logging
 import time
 import os
 import re
-from pathlib import Path
+import random
+import threading
+from functools import lru_cache
 from typing import Dict, Any, Optional, Callable
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
 
 logger = logging.getLogger(__name__)
 
+# Trailing 11-character YouTube video ID in a filename stem
+VIDEO_ID_RE = re.compile(r'([a-zA-Z0-9_-]{11})$')
+
+# One YoutubeDL instance per worker thread, reused across videos
+_ydl_local = threading.local()
+_ydl_instances = []
+_ydl_instances_lock = threading.Lock()
+
 
 class DownloadProgressHook:
     """Progress hook for yt-dlp to track download progress."""
     
+    # Minimum seconds between two progress log lines for the same video
+    LOG_INTERVAL = 0.5
+    
     def __init__(self, video_title: str, logger: logging.Logger):
         self.video_title = video_title
         self.logger = logger
         self.status = None
+        self._last_logged_percent = -1
+        self._last_logged_time = 0.0
     
     def __call__(self, d: Dict[str, Any]) -> None:
         if d['status'] == 'downloading':
-            if 'total_bytes' in d:
-                percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            if not total:
+                return
+            percent = (d['downloaded_bytes'] / total) * 100
+            # Only log when the whole-number percentage moves, and not more
+            # often than LOG_INTERVAL
+            now = time.monotonic()
+            if (int(percent) == self._last_logged_percent
+                    or now - self._last_logged_time < self.LOG_INTERVAL):
+                return
+            self._last_logged_percent = int(percent)
+            self._last_logged_time = now
+            
+            if d.get('total_bytes'):
                 self.logger.info(
-                    f"Downloading '{self.video_title}': "
-                    f"{percent:.1f}% ({d['downloaded_bytes']}/{d['total_bytes']} bytes)"
+                    "Downloading '%s': %.1f%% (%d/%d bytes)",
+                    self.video_title, percent, d['downloaded_bytes'], d['total_bytes']
                 )
-            elif 'total_bytes_estimate' in d:
-                percent = (d['downloaded_bytes'] / d['total_bytes_estimate']) * 100
+            else:
                 self.logger.info(
-                    f"Downloading '{self.video_title}': "
-                    f"{percent:.1f}% (estimated)"
+                    "Downloading '%s': %.1f%% (estimated)",
+                    self.video_title, percent
                 )
         elif d['status'] == 'finished':
             self.logger.info(f"Finished downloading '{self.video_title}'")
@@ -42,6 +68,186 @@ class DownloadProgressHook:
             self.status = 'error'
 
 
+def _get_ydl(ydl_opts: Dict[str, Any], outtmpl_path: str, hook: DownloadProgressHook) -> yt_dlp.YoutubeDL:
+    """
+    Get this thread's YoutubeDL instance, creating it on first use.
+    
+    The instance is rebuilt only when the per-run options (format, postprocessors,
+    cookies) change; the output template and progress hook are swapped per video.
+    
+    yt-dlp may call progress hooks on its own threads (e.g. the fragment pool
+    used with concurrent_fragment_downloads > 1), so the current hook is bound
+    to the instance rather than looked up on the calling thread.
+    
+    Args:
+        ydl_opts: yt-dlp options shared by every video in the run
+        outtmpl_path: Output template for the current video
+        hook: Progress hook for the current video
+        
+    Returns:
+        Reusable YoutubeDL instance
+    """
+    opts_key = repr(sorted(ydl_opts.items()))
+    ydl = getattr(_ydl_local, 'ydl', None)
+    if ydl is None or _ydl_local.opts_key != opts_key:
+        if ydl is not None:
+            _release_ydl(ydl)
+        # Hook of the video this instance is downloading, swapped per video
+        hook_slot: Dict[str, Optional[DownloadProgressHook]] = {'hook': None}
+        
+        def dispatch_progress(d: Dict[str, Any]) -> None:
+            current_hook = hook_slot['hook']
+            if current_hook is not None:
+                current_hook(d)
+        
+        ydl = yt_dlp.YoutubeDL({
+            **ydl_opts,
+            'outtmpl': outtmpl_path,
+            'progress_hooks': [dispatch_progress],
+        })
+        _ydl_local.ydl = ydl
+        _ydl_local.opts_key = opts_key
+        _ydl_local.hook_slot = hook_slot
+        with _ydl_instances_lock:
+            _ydl_instances.append(ydl)
+    
+    ydl.params['outtmpl']['default'] = outtmpl_path
+    _ydl_local.hook_slot['hook'] = hook
+    return ydl
+
+
+def _release_ydl(ydl: yt_dlp.YoutubeDL) -> None:
+    """Close a pooled YoutubeDL instance (saves cookies) and forget it."""
+    with _ydl_instances_lock:
+        if ydl in _ydl_instances:
+            _ydl_instances.remove(ydl)
+    try:
+        ydl.close()
+    except Exception as e:
+        logger.debug(f"Error closing yt-dlp instance: {e}")
+
+
+def close_ydl_pool() -> None:
+    """Close every pooled YoutubeDL instance."""
+    with _ydl_instances_lock:
+        instances = list(_ydl_instances)
+    for ydl in instances:
+        _release_ydl(ydl)
+
+
+@lru_cache(maxsize=16)
+def _format_selector(min_resolution: str, max_resolution: str, format_preference: str, audio_only: bool) -> str:
+    """
+    Build the yt-dlp format selector for the given preferences.
+    
+    Args:
+        min_resolution: Minimum resolution (e.g., "720p")
+        max_resolution: Maximum resolution (e.g., "1080p")
+        format_preference: Preferred format (e.g., "mp4")
+        audio_only: If True, select best audio only
+        
+    Returns:
+        yt-dlp format selector string
+    """
+    if audio_only:
+        # Best audio quality
+        return "bestaudio/best"
+    
+    # Prefer: best video+audio merged, between min and max resolution, prefer mp4
+    min_height = int(min_resolution.replace('p', ''))
+    max_height = int(max_resolution.replace('p', ''))
+    
+    # Format selector: best video between min and max resolution + best audio
+    format_selector = f"bestvideo[height>={min_height}][height<={max_height}]+bestaudio/best[height>={min_height}][height<={max_height}]"
+    if format_preference.lower() == "mp4":
+        format_selector += f"/best[ext=mp4][height<={max_height}]/best[height<={max_height}]"
+    return format_selector
+
+
+# Upper bound for a single retry wait, in seconds
+MAX_RETRY_DELAY = 60
+
+
+def _backoff_delay(retry_delay: float, attempt: int, error: Optional[BaseException] = None) -> float:
+    """
+    Compute how long to wait before the next download attempt.
+    
+    Uses exponential backoff with jitter so parallel workers don't retry in lockstep.
+    If the server answered 429 with a Retry-After header, that value is honoured instead.
+    
+    Args:
+        retry_delay: Base delay in seconds (from config)
+        attempt: Number of the attempt that just failed (1-based)
+        error: Exception raised by the failed attempt, if any
+        
+    Returns:
+        Delay in seconds
+    """
+    exc_info = getattr(error, 'exc_info', None)
+    cause = exc_info[1] if exc_info else None
+    if getattr(cause, 'status', None) == 429:
+        headers = getattr(getattr(cause, 'response', None), 'headers', None) or {}
+        try:
+            return min(MAX_RETRY_DELAY, float(headers.get('Retry-After')))
+        except (TypeError, ValueError):
+            pass
+    
+    return min(MAX_RETRY_DELAY, retry_delay * (2 ** (attempt - 1)) * random.uniform(0.5, 1.5))
+
+
+COMMON_AUDIO_EXTS = ['.mp3', '.m4a', '.webm', '.flac', '.wav', '.opus']
+
+
+# Extensions yt-dlp may leave behind for a merged video download
+VIDEO_EXTS = ['.mp4', '.webm', '.mkv']
+
+
+def _audio_exts(audio_format: str) -> list:
+    """Audio extensions to look for, the converted target format first."""
+    exts = []
+    if audio_format and audio_format != 'best':
+        exts.append(f".{audio_format}")
+    exts.extend(ext for ext in COMMON_AUDIO_EXTS if ext not in exts)
+    return exts
+
+
+def _locate_existing(base: str, extensions: list) -> Optional[str]:
+    """
+    Find the first existing file named base + extension, probing each candidate once.
+    
+    Args:
+        base: Full path of the file without extension
+        extensions: Candidate extensions, in order of preference
+        
+    Returns:
+        Path of the existing file, or None if nothing was found
+    """
+    for ext in extensions:
+        check_path = base + ext
+        if os.path.exists(check_path):
+            return check_path
+    return None
+
+
+def _reported_filepath(info: Optional[Dict[str, Any]]) -> Optional[str]:
+    """
+    Get the final file path yt-dlp reports for a finished download.
+    
+    Args:
+        info: Info dict returned by YoutubeDL.extract_info(download=True)
+        
+    Returns:
+        Path of the downloaded file if it exists, None otherwise
+    """
+    if not info:
+        return None
+    for download in info.get('requested_downloads') or []:
+        filepath = download.get('filepath')
+        if filepath and os.path.exists(filepath):
+            return filepath
+    return None
+
+
 def download_video(
     video: Dict[str, Any],
     download_path: str,
@@ -55,7 +261,8 @@ def download_video(
     cookies_file: Optional[str] = None,
     cookies_from_browser: Optional[str] = None,
     audio_only: bool = False,
-    audio_format: str = "best"
+    audio_format: str = "best",
+    concurrent_fragments: int = 1
 ) -> Dict[str, Any]:
     """
     Download a single video with retry logic.
@@ -74,6 +281,7 @@ def download_video(
         cookies_from_browser: Browser to extract cookies from (e.g., 'chrome', 'firefox')
         audio_only: If True, download only audio
         audio_format: Audio format preference (e.g. "best", "mp3", "m4a")
+        concurrent_fragments: Number of fragments of a DASH/HLS format to download in parallel
         
     Returns:
         Dictionary with download result: success, filepath, error
@@ -120,66 +328,40 @@ def download_video(
         filename_tmpl = f"{filename_base}.%(ext)s"
     
     # We construct the path for yt-dlp outtmpl
-    outtmpl_path = str(Path(download_path) / filename_tmpl)
+    # Paths are built by plain concatenation: titles may contain dots, which
+    # Path.with_suffix would mistake for an extension
+    outtmpl_path = os.path.join(download_path, filename_tmpl)
+    base = os.path.join(download_path, filename_base)
     
     # Check if file exists locally with expected extension
-    # This is a bit tricky for audio since we don't know the final extension for sure yet if using "best"
-    # But for video we expect mp4
-    # Check if file exists locally with expected extension
-    # If using audio conversion, we expect the target format
-    expected_filepath = None
-    
-    if audio_only:
-        if audio_format and audio_format != 'best':
-             expected_filepath = (Path(download_path) / filename_base).with_suffix(f".{audio_format}")
-    else:
-         expected_filepath = (Path(download_path) / filename_base).with_suffix('.mp4')
-
-    if expected_filepath and expected_filepath.exists():
-        logger.info(f"Video file exists locally: {expected_filepath.name}")
+    # If using audio conversion, we expect the target format first
+    existing_file = _locate_existing(base, _audio_exts(audio_format) if audio_only else ['.mp4'])
+    if existing_file:
+        kind = "Audio" if audio_only else "Video"
+        logger.info(f"{kind} file exists locally: {os.path.basename(existing_file)}")
         # Mark in tracker if not already there
         if tracker_file:
             try:
-                file_size = expected_filepath.stat().st_size
-                mark_video_downloaded(video_id, video_title, str(expected_filepath), tracker_file, file_size)
+                file_size = os.path.getsize(existing_file)
+                mark_video_downloaded(video_id, video_title, existing_file, tracker_file, file_size)
             except Exception as e:
                 logger.warning(f"Could not update tracker: {e}")
         return {
             'success': True,
-            'filepath': str(expected_filepath),
+            'filepath': existing_file,
             'skipped': True,
             'video_id': video_id,
             'video_title': video_title
         }
     
-    # Check for other common audio extensions if audio_only
-    if audio_only:
-        common_audio_exts = ['.mp3', '.m4a', '.webm', '.flac', '.wav', '.opus']
-        for ext in common_audio_exts:
-            check_path = (Path(download_path) / filename_base).with_suffix(ext)
-            if check_path.exists():
-                logger.info(f"Audio file exists locally: {check_path.name}")
-                if tracker_file:
-                    try:
-                        file_size = check_path.stat().st_size
-                        mark_video_downloaded(video_id, video_title, str(check_path), tracker_file, file_size)
-                    except Exception:
-                        pass
-                return {
-                    'success': True,
-                    'filepath': str(check_path),
-                    'skipped': True,
-                    'video_id': video_id,
-                    'video_title': video_title
-                }
-    
     # Configure format selector
+    format_selector = _format_selector(min_resolution, max_resolution, format_preference, audio_only)
     if audio_only:
-        # Best audio quality
-        format_selector = "bestaudio/best"
         logger.debug(f"Audio-only mode. Format selector: {format_selector}")
         
-        # Add post-processors for audio conversion
+        # Add post-processors for audio conversion.
+        # yt-dlp runs the conversion in an ffmpeg subprocess, so the worker
+        # thread only waits on it and other downloads keep running meanwhile.
         if audio_format and audio_format != 'best':
             postprocessors = [{
                 'key': 'FFmpegExtractAudio',
@@ -190,25 +372,22 @@ def download_video(
         else:
              postprocessors = []
     else:
-        # Prefer: best video+audio merged, between min and max resolution, prefer mp4
-        min_height = int(min_resolution.replace('p', ''))
-        max_height = int(max_resolution.replace('p', ''))
-        
-        # Format selector: best video between min and max resolution + best audio
-        format_selector = f"bestvideo[height>={min_height}][height<={max_height}]+bestaudio/best[height>={min_height}][height<={max_height}]"
-        if format_preference.lower() == "mp4":
-            format_selector += f"/best[ext=mp4][height<={max_height}]/best[height<={max_height}]"
-        
         logger.debug(f"Format selector: {format_selector} (resolution: {min_resolution} to {max_resolution})")
     
-    # Configure yt-dlp options
+    # Configure yt-dlp options (output template and progress hook are set per video)
     ydl_opts = {
         'format': format_selector,
-        'outtmpl': outtmpl_path,
         'quiet': False,
         'no_warnings': False,
-        'progress_hooks': [DownloadProgressHook(video_title, logger)],
+        # Larger read buffer: fewer progress callbacks per downloaded MB
+        'buffersize': 1024 * 1024 if not audio_only else 256 * 1024,
+        # Fail stalled connections instead of hanging a worker; the pooled
+        # YoutubeDL keeps its keep-alive connections open between videos
+        'socket_timeout': 30,
+        # Fetch DASH/HLS fragments in parallel instead of one by one
+        'concurrent_fragment_downloads': max(1, concurrent_fragments),
     }
+    progress_hook = DownloadProgressHook(video_title, logger)
     
     if audio_only and 'postprocessors' in locals() and postprocessors:
          ydl_opts['postprocessors'] = postprocessors
@@ -228,60 +407,36 @@ def download_video(
         try:
             logger.info(f"Downloading video {attempt}/{retry_attempts}: {video_title}")
             
-            with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-                ydl.download([video_url])
+            ydl = _get_ydl(ydl_opts, outtmpl_path, progress_hook)
+            info = ydl.extract_info(video_url, download=True)
             
             # Verify file was created
-            # yt-dlp might add different extensions, so check for common ones
-            # Verify file was created
-            possible_files = []
-            if audio_only:
-                if audio_format and audio_format != 'best':
-                    possible_files.append((Path(download_path) / filename_base).with_suffix(f".{audio_format}"))
-                
-                # Also check common extensions in case conversion failed or 'best' was used
-                possible_files.extend([
-                    (Path(download_path) / filename_base).with_suffix('.mp3'),
-                    (Path(download_path) / filename_base).with_suffix('.m4a'),
-                    (Path(download_path) / filename_base).with_suffix('.webm'),
-                    (Path(download_path) / filename_base).with_suffix('.opus'),
-                    (Path(download_path) / filename_base).with_suffix('.flac'),
-                    (Path(download_path) / filename_base).with_suffix('.wav'),
-                ])
-            else:
-                video_file_base = Path(download_path) / filename_base
-                possible_files = [
-                    video_file_base.with_suffix('.mp4'),
-                    video_file_base.with_suffix('.webm'),
-                    video_file_base.with_suffix('.mkv'),
-                ]
-            
-            downloaded_file = None
-            for possible_file in possible_files:
-                if possible_file.exists():
-                    downloaded_file = possible_file
-                    break
+            # yt-dlp reports the final path (after merging/conversion); only
+            # if it doesn't, probe the common extensions it might have used
+            downloaded_file = _reported_filepath(info)
+            if not downloaded_file:
+                downloaded_file = _locate_existing(base, _audio_exts(audio_format) if audio_only else VIDEO_EXTS)
             
             if downloaded_file:
                 # Rename to .mp4 if needed (video only)
-                if not audio_only and downloaded_file.suffix != '.mp4':
-                    final_path = downloaded_file.with_suffix('.mp4')
-                    downloaded_file.rename(final_path)
+                if not audio_only and not downloaded_file.endswith('.mp4'):
+                    final_path = base + '.mp4'
+                    os.rename(downloaded_file, final_path)
                     downloaded_file = final_path
                 
                 # Mark as downloaded in tracker
                 if tracker_file:
                     try:
-                        file_size = downloaded_file.stat().st_size
-                        mark_video_downloaded(video_id, video_title, str(downloaded_file), tracker_file, file_size)
+                        file_size = os.path.getsize(downloaded_file)
+                        mark_video_downloaded(video_id, video_title, downloaded_file, tracker_file, file_size)
                         logger.debug(f"Marked video {video_id} as downloaded in tracker")
                     except Exception as e:
                         logger.warning(f"Could not update tracker: {e}")
                 
-                logger.info(f"Successfully downloaded: {downloaded_file.name}")
+                logger.info(f"Successfully downloaded: {os.path.basename(downloaded_file)}")
                 return {
                     'success': True,
-                    'filepath': str(downloaded_file),
+                    'filepath': downloaded_file,
                     'skipped': False,
                     'video_id': video_id,
                     'video_title': video_title
@@ -315,15 +470,17 @@ def download_video(
             else:
                 logger.warning(f"Download attempt {attempt} failed: {error_msg}")
                 if attempt < retry_attempts:
-                    logger.info(f"Retrying in {retry_delay} seconds...")
-                    time.sleep(retry_delay)
+                    delay = _backoff_delay(retry_delay, attempt, e)
+                    logger.info(f"Retrying in {delay:.1f} seconds...")
+                    time.sleep(delay)
                     
         except Exception as e:
             last_error = str(e)
             logger.warning(f"Download attempt {attempt} failed with error: {e}")
             if attempt < retry_attempts:
-                logger.info(f"Retrying in {retry_delay} seconds...")
-                time.sleep(retry_delay)
+                delay = _backoff_delay(retry_delay, attempt, e)
+                logger.info(f"Retrying in {delay:.1f} seconds...")
+                time.sleep(delay)
     
     # All retries failed
     logger.error(f"Failed to download after {retry_attempts} attempts: {video_title}")
@@ -350,7 +507,8 @@ def download_playlist(
     cookies_file: Optional[str] = None,
     cookies_from_browser: Optional[str] = None,
     audio_only: bool = False,
-    audio_format: str = "best"
+    audio_format: str = "best",
+    concurrent_fragments: int = 1
 ) -> Dict[str, Any]:
     """
     Download multiple videos with concurrent downloads.
@@ -370,6 +528,7 @@ def download_playlist(
         cookies_from_browser: Browser to extract cookies from
         audio_only: Download audio only
         audio_format: Audio format preference
+        concurrent_fragments: Fragments downloaded in parallel per video
         
     Returns:
         Dictionary with download statistics
@@ -385,26 +544,25 @@ def download_playlist(
             from .utils import get_downloaded_videos
         except ImportError:
             from utils import get_downloaded_videos
-        # Use tracker file if provided, otherwise fall back to checking files
+        # Use tracker file if provided, otherwise fall back to checking files.
+        # The tracker is read once into a frozenset; files on disk are still
+        # picked up per video by download_video's own existence check, so the
+        # directory does not need to be scanned here.
         if tracker_file:
-            downloaded_ids = get_downloaded_videos(tracker_file, download_path)
+            downloaded_ids = frozenset(get_downloaded_videos(tracker_file))
         else:
             # Fallback: check local files only (backwards compatibility)
-            download_dir = Path(download_path)
+            # If audio only, we also need to check common audio extensions
+            known_exts = {'.mp4', *COMMON_AUDIO_EXTS} if audio_only else {'.mp4'}
             downloaded_ids = set()
-            if download_dir.exists():
-                for file in download_dir.glob("*.mp4"):
-                    filename = file.stem
-                    video_id_match = re.search(r'([a-zA-Z0-9_-]{11})$', filename)
-                    if video_id_match:
-                        downloaded_ids.add(video_id_match.group(1))
-                
-                # If audio only, we also need to check common audio extensions
-                if audio_only:
-                     for file in download_dir.glob("*"):
-                         if file.suffix in ['.mp3', '.m4a', '.webm', '.opus', '.flac', '.wav']:
-                            filename = file.stem
-                            video_id_match = re.search(r'([a-zA-Z0-9_-]{11})$', filename)
+            if os.path.isdir(download_path):
+                with os.scandir(download_path) as entries:
+                    for entry in entries:
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        filename, ext = os.path.splitext(entry.name)
+                        if ext in known_exts:
+                            video_id_match = VIDEO_ID_RE.search(filename)
                             if video_id_match:
                                 downloaded_ids.add(video_id_match.group(1))
         
@@ -432,8 +590,8 @@ def download_playlist(
     failed = 0
     skipped = 0
     
-    # Download with thread pool for concurrency
-    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+    # Download with thread pool for concurrency (no more workers than videos left)
+    with ThreadPoolExecutor(max_workers=max(1, min(max_concurrent, len(videos)))) as executor:
         # Submit all download tasks
         future_to_video = {
             executor.submit(
@@ -450,7 +608,8 @@ def download_playlist(
                 cookies_file,
                 cookies_from_browser,
                 audio_only,
-                audio_format
+                audio_format,
+                concurrent_fragments
             ): video
             for video in videos
         }
@@ -479,6 +638,20 @@ def download_playlist(
                     'error': str(e)
                 })
     
+    # Worker threads are gone; close their yt-dlp instances
+    close_ydl_pool()
+    
+    # Write any tracker entries still buffered
+    if tracker_file:
+        try:
+            from .utils import flush_download_tracker
+        except ImportError:
+            from utils import flush_download_tracker
+        try:
+            flush_download_tracker(tracker_file)
+        except Exception as e:
+            logger.warning(f"Could not update tracker: {e}")
+    
     logger.info(f"Download complete: {successful} successful, {failed} failed, {skipped} skipped")
     
     return {
@@ -9,8 +9,11 @@ try:
     from .utils import (
         load_config,
         setup_logging,
-        save_playlist_data,
-        load_playlist_data
+        PlaylistStream,
+        load_playlist_data,
+        load_page_cache,
+        save_page_cache,
+        get_downloaded_videos
     )
     from .oauth_auth import get_authenticated_service
     from .playlist_fetcher import (
@@ -18,7 +21,8 @@ try:
         fetch_playlist_by_id,
         find_playlist_by_name,
         list_user_playlists,
-        remove_video_from_watch_later
+        get_watch_later_playlist_id,
+        remove_videos_from_watch_later
     )
     from .downloader import download_playlist
 except ImportError:
@@ -29,8 +33,11 @@ except ImportError:
     from utils import (
         load_config,
         setup_logging,
-        save_playlist_data,
-        load_playlist_data
+        PlaylistStream,
+        load_playlist_data,
+        load_page_cache,
+        save_page_cache,
+        get_downloaded_videos
     )
     from oauth_auth import get_authenticated_service
     from playlist_fetcher import (
@@ -38,7 +45,8 @@ except ImportError:
         fetch_playlist_by_id,
         find_playlist_by_name,
         list_user_playlists,
-        remove_video_from_watch_later
+        get_watch_later_playlist_id,
+        remove_videos_from_watch_later
     )
     from downloader import download_playlist
 
@@ -138,17 +146,45 @@ def main():
     
     if not args.download_only:
         try:
+            # Each fetched page is written to disk as soon as it arrives
+            # An earlier fetch aborted mid-way (e.g. quota exhausted) is resumed
+            playlist_stream = PlaylistStream(config['playlist_data_file'], resume=True)
+            resume_from = playlist_stream.resume_from
+            # ETags of previously fetched pages let unchanged pages be skipped
+            page_cache_file = config.get('page_cache_file', './data/page_cache.json')
+            page_cache = load_page_cache(page_cache_file)
+            # Videos that will be skipped anyway don't need their details fetched
+            skip_ids = None
+            if config.get('resume_downloads', True) and not args.fetch_only:
+                skip_ids = get_downloaded_videos(
+                    config.get('download_tracker_file', './data/downloaded_videos.json')
+                )
+            
             if args.playlist_id:
                 # Fetch specific playlist by ID
                 logger.info(f"Fetching playlist with ID: {args.playlist_id}")
-                playlist_data = fetch_playlist_by_id(youtube_service, args.playlist_id)
+                playlist_data = fetch_playlist_by_id(
+                    youtube_service,
+                    args.playlist_id,
+                    on_page=playlist_stream,
+                    page_cache=page_cache,
+                    resume_from=resume_from,
+                    skip_ids=skip_ids
+                )
             elif args.playlist_name:
                 # Fetch playlist by name
                 logger.info(f"Searching for playlist: '{args.playlist_name}'")
                 playlist = find_playlist_by_name(youtube_service, args.playlist_name)
                 if playlist:
                     logger.info(f"Found playlist: '{playlist['title']}' with {playlist['item_count']} items")
-                    playlist_data = fetch_playlist_by_id(youtube_service, playlist['id'])
+                    playlist_data = fetch_playlist_by_id(
+                        youtube_service,
+                        playlist['id'],
+                        on_page=playlist_stream,
+                        page_cache=page_cache,
+                        resume_from=resume_from,
+                        skip_ids=skip_ids
+                    )
                 else:
                     logger.error(f"Playlist '{args.playlist_name}' not found")
                     logger.info("Use --list-playlists to see all available playlists")
@@ -158,14 +194,32 @@ def main():
                 logger.info("Fetching Watch Later playlist...")
                 # Try to use default playlist name from config
                 default_name = config.get('default_playlist_name')
-                playlist_data = fetch_watch_later_playlist(youtube_service, playlist_name=default_name)
+                playlist_data = fetch_watch_later_playlist(
+                    youtube_service,
+                    playlist_name=default_name,
+                    on_page=playlist_stream,
+                    page_cache=page_cache,
+                    resume_from=resume_from,
+                    skip_ids=skip_ids
+                )
+            
+            # Save playlist data (replaces the previous cache atomically) whenever
+            # pages were fetched, even if all their videos were skipped, so the
+            # cursor of an interrupted fetch never outlives a finished one
+            if playlist_stream.pages:
+                playlist_stream.commit()
+                if resume_from:
+                    # The fetch only returned the videos after the resume point
+                    playlist_data = load_playlist_data(config['playlist_data_file'])
+            save_page_cache(page_cache, page_cache_file)
             
             if not playlist_data:
-                logger.warning("No videos found in Watch Later playlist")
+                if skip_ids:
+                    logger.warning("No videos found in Watch Later playlist that are not downloaded yet")
+                else:
+                    logger.warning("No videos found in Watch Later playlist")
                 sys.exit(0)
             
-            # Save playlist data
-            save_playlist_data(playlist_data, config['playlist_data_file'])
             logger.info(f"Saved {len(playlist_data)} videos to {config['playlist_data_file']}")
             
         except Exception as e:
@@ -208,7 +262,8 @@ def main():
             cookies_file=config.get('cookies_file'),
             cookies_from_browser=config.get('cookies_from_browser'),
             audio_only=args.audio_only or config.get('audio_only', False),
-            audio_format=config.get('audio_format', 'best')
+            audio_format=config.get('audio_format', 'best'),
+            concurrent_fragments=config.get('concurrent_fragment_downloads', 1)
         )
         
         # Log summary
@@ -236,12 +291,25 @@ def main():
         # Auto-clean Watch Later if enabled
         if config.get('auto_clean_watch_later', False) and youtube_service:
             logger.info("Auto-clean enabled: Removing downloaded videos from Watch Later...")
-            cleaned_count = 0
-            for result in download_stats['results']:
-                if result.get('success') and not result.get('skipped'):
-                    video_id = result.get('video_id')
-                    if video_id and remove_video_from_watch_later(youtube_service, video_id):
-                        cleaned_count += 1
+            # Playlist item IDs from the fetch let us delete without a lookup,
+            # but only if the videos were fetched from the Watch Later playlist
+            watch_later_id = get_watch_later_playlist_id(youtube_service)
+            playlist_item_ids = {
+                video['id']: video['playlist_item_id']
+                for video in playlist_data
+                if video.get('playlist_item_id') and video.get('playlist_id') == watch_later_id
+            }
+            video_ids = [
+                result['video_id']
+                for result in download_stats['results']
+                if result.get('success') and not result.get('skipped') and result.get('video_id')
+            ]
+            cleaned_count = remove_videos_from_watch_later(
+                youtube_service,
+                video_ids,
+                playlist_item_ids=playlist_item_ids,
+                max_workers=min(8, config.get('max_concurrent_downloads', 3))
+            )
             logger.info(f"Removed {cleaned_count} videos from Watch Later")
         
         logger.info(f"End time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
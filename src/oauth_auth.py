@@ -7,7 +7,9 @@ from typing import Optional, Dict, Any
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
+from googleapiclient.http import build_http
 from googleapiclient.errors import HttpError
 
 
@@ -19,6 +21,52 @@ SCOPES = [
     'https://www.googleapis.com/auth/youtube.force-ssl'  # For removing videos from playlists
 ]
 
+# Socket timeout for YouTube Data API requests, in seconds
+API_TIMEOUT = 30
+
+
+def _save_token(creds: Credentials, token_path: Path) -> None:
+    """
+    Atomically write credentials to the token file.
+    
+    The token is written to a temp file (readable by the owner only) and moved
+    into place with os.replace, so a crash never leaves a torn token file that
+    would force a new OAuth flow.
+    
+    Args:
+        creds: Credentials to persist
+        token_path: Path of the token file
+    """
+    token_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = token_path.with_name(token_path.name + '.tmp')
+    try:
+        fd = os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'w') as token:
+            token.write(creds.to_json())
+        os.replace(temp_path, token_path)
+    except Exception:
+        if temp_path.exists():
+            try:
+                os.remove(temp_path)
+            except OSError:
+                pass
+        raise
+
+
+def build_authorized_http(creds: Credentials) -> AuthorizedHttp:
+    """
+    Build an authorized HTTP connection with the API socket timeout.
+    
+    Args:
+        creds: OAuth credentials to sign requests with
+        
+    Returns:
+        AuthorizedHttp whose requests time out after API_TIMEOUT seconds
+    """
+    http = build_http()
+    http.timeout = API_TIMEOUT
+    return AuthorizedHttp(creds, http=http)
+
 
 def get_authenticated_service(
     credentials_file: str,
@@ -45,7 +93,9 @@ def get_authenticated_service(
         except Exception as e:
             logger.warning(f"Error loading token file: {e}")
     
-    # If there are no (valid) credentials available, let the user log in
+    # If there are no (valid) credentials available, let the user log in.
+    # creds.valid already treats a token about to expire as expired, so a
+    # still-usable token skips the refresh round trip entirely.
     if not creds or not creds.valid:
         if creds and creds.expired and creds.refresh_token:
             logger.info("Refreshing expired credentials...")
@@ -55,7 +105,7 @@ def get_authenticated_service(
                 logger.error(f"Error refreshing token: {e}")
                 creds = None
         
-        if not creds:
+        if not creds or not creds.valid:
             logger.info("Starting OAuth flow...")
             if not Path(credentials_file).exists():
                 raise FileNotFoundError(
@@ -71,14 +121,15 @@ def get_authenticated_service(
             logger.info("OAuth authentication successful")
         
         # Save the credentials for the next run
-        token_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(token_path, 'w') as token:
-            token.write(creds.to_json())
+        _save_token(creds, token_path)
         logger.info(f"Saved credentials to {token_file}")
     
     # Build and return the YouTube service
+    # Use the discovery document bundled with google-api-python-client instead
+    # of fetching it over the network on every start. All API calls go through
+    # one authorized HTTP object, so its keep-alive connection is reused.
     try:
-        service = build('youtube', 'v3', credentials=creds)
+        service = build('youtube', 'v3', http=build_authorized_http(creds), static_discovery=True, cache_discovery=False)
         logger.info("YouTube Data API service initialized")
         return service
     except Exception as e:
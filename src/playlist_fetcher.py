@@ -1,14 +1,63 @@
 """Fetch YouTube playlists using YouTube Data API v3."""
 import logging
-import re
-from typing import List, Dict, Any, Optional
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import AbstractSet, List, Dict, Any, Optional, Callable, Iterable, Iterator, Set, Tuple
 from googleapiclient.errors import HttpError
 
+try:
+    from .oauth_auth import build_authorized_http
+except ImportError:
+    from oauth_auth import build_authorized_http
+
 
 logger = logging.getLogger(__name__)
 
+# Seconds per ISO 8601 duration unit (YouTube uses W/D/H/M/S, months never appear)
+_DURATION_UNITS = {'W': 604800, 'D': 86400, 'H': 3600, 'M': 60, 'S': 1}
+
+# Partial-response 'fields' selectors: only what we read from each response
+PLAYLISTS_FIELDS = 'nextPageToken,items(id,snippet(title,description),contentDetails/itemCount)'
+PLAYLIST_ITEMS_FIELDS = 'etag,nextPageToken,pageInfo,items(id,snippet/position,contentDetails/videoId)'
+VIDEOS_FIELDS = 'items(id,snippet(title,channelTitle,publishedAt),contentDetails/duration)'
+
+WATCH_URL_PREFIX = 'https://www.youtube.com/watch?v='
+
+# Retries (with exponential backoff) for rate-limit and server errors; the
+# client library does not retry quotaExceeded, which only resets daily
+API_NUM_RETRIES = 3
+
+# videos.list detail requests allowed in flight while pages are being listed
+DETAIL_WORKERS = 4
+
+# Sub-requests per BatchHttpRequest (the API caps a batch at 1000)
+BATCH_SIZE = 50
+
+
+def _service_cache(service: Any) -> Dict[str, Any]:
+    """
+    Get a cache dict that lives as long as the given service object.
+    
+    Args:
+        service: Authenticated YouTube Data API service
+        
+    Returns:
+        Mutable dictionary for memoized lookups on this service
+    """
+    cache = getattr(service, '_yt_downloader_cache', None)
+    if cache is None:
+        cache = {}
+        setattr(service, '_yt_downloader_cache', cache)
+    return cache
+
 
-def find_playlist_by_name(service: Any, playlist_name: str, case_sensitive: bool = False) -> Optional[Dict[str, Any]]:
+def find_playlist_by_name(
+    service: Any,
+    playlist_name: str,
+    case_sensitive: bool = False,
+    playlists: Optional[Iterable[Dict[str, Any]]] = None
+) -> Optional[Dict[str, Any]]:
     """
     Find a playlist by name (supports partial matching).
     
@@ -16,43 +65,55 @@ def find_playlist_by_name(service: Any, playlist_name: str, case_sensitive: bool
         service: Authenticated YouTube Data API service
         playlist_name: Name of the playlist to find
         case_sensitive: Whether to match case exactly
+        playlists: Optional playlists (e.g. from list_user_playlists) to search
+            instead of fetching them
         
     Returns:
         Playlist dictionary with id, title, and itemCount, or None if not found
     """
     logger.info(f"Searching for playlist: '{playlist_name}'")
-    playlists = list_user_playlists(service)
+    if playlists is None:
+        # Pages after an exact match are never fetched
+        playlists = iter_user_playlists(service)
     
     search_name = playlist_name if case_sensitive else playlist_name.lower()
     
-    # Try exact match first
+    # One pass: an exact match wins, otherwise the first partial match
+    partial_match = None
     for playlist in playlists:
         title = playlist['title'] if case_sensitive else playlist['title'].lower()
         if title == search_name:
             logger.info(f"Found exact match: '{playlist['title']}' (ID: {playlist['id']})")
             return playlist
+        if partial_match is None and (search_name in title or title in search_name):
+            partial_match = playlist
     
-    # Try partial match
-    for playlist in playlists:
-        title = playlist['title'] if case_sensitive else playlist['title'].lower()
-        if search_name in title or title in search_name:
-            logger.info(f"Found partial match: '{playlist['title']}' (ID: {playlist['id']})")
-            return playlist
+    if partial_match is not None:
+        logger.info(f"Found partial match: '{partial_match['title']}' (ID: {partial_match['id']})")
+        return partial_match
     
     logger.warning(f"Playlist '{playlist_name}' not found")
     return None
 
 
-def list_user_playlists(service: Any) -> List[Dict[str, Any]]:
+def iter_user_playlists(service: Any) -> Iterator[Dict[str, Any]]:
     """
-    List all playlists for the authenticated user.
+    Iterate over the authenticated user's playlists, fetching pages on demand.
+    
+    Stopping early skips the remaining pages. A complete pass is memoized per
+    service, like list_user_playlists().
     
     Args:
         service: Authenticated YouTube Data API service
         
-    Returns:
-        List of playlist dictionaries with id, title, and itemCount
+    Yields:
+        Playlist dictionaries with id, title, and itemCount
     """
+    cache = _service_cache(service)
+    if 'playlists' in cache:
+        yield from cache['playlists']
+        return
+    
     logger.info("Fetching user's playlists...")
     playlists = []
     next_page_token = None
@@ -63,7 +124,8 @@ def list_user_playlists(service: Any) -> List[Dict[str, Any]]:
                 part='snippet,contentDetails',
                 mine=True,
                 maxResults=50,
-                pageToken=next_page_token
+                pageToken=next_page_token,
+                fields=PLAYLISTS_FIELDS
             )
             
             response = request.execute()
@@ -79,117 +141,402 @@ def list_user_playlists(service: Any) -> List[Dict[str, Any]]:
                     'description': playlist['snippet'].get('description', ''),
                 }
                 playlists.append(playlist_data)
+                yield playlist_data
             
             next_page_token = response.get('nextPageToken')
             if not next_page_token:
                 break
         
         logger.info(f"Found {len(playlists)} playlists")
-        return playlists
+        cache['playlists'] = playlists
         
     except HttpError as e:
         logger.error(f"Error listing playlists: {e}")
-        return []
     except Exception as e:
         logger.error(f"Unexpected error listing playlists: {e}")
-        return []
 
 
-def fetch_playlist_by_id(service: Any, playlist_id: str) -> List[Dict[str, Any]]:
+def list_user_playlists(service: Any) -> List[Dict[str, Any]]:
     """
-    Fetch all videos from any YouTube playlist by ID.
+    List all playlists for the authenticated user.
+    
+    The list is fetched once per service; later calls reuse it until a
+    playlist item is removed through this module.
+    
+    Args:
+        service: Authenticated YouTube Data API service
+        
+    Returns:
+        List of playlist dictionaries with id, title, and itemCount (the
+        playlists fetched before an API error, if one occurs)
+    """
+    return list(iter_user_playlists(service))
+
+
+def _service_credentials(service: Any) -> Optional[Any]:
+    """Get the credentials of the service's authorized HTTP object, if it has any."""
+    return getattr(getattr(service, '_http', None), 'credentials', None)
+
+
+def _worker_http(service: Any) -> Optional[Any]:
+    """
+    Create a separate authorized HTTP object for requests made off the main thread.
+    
+    httplib2.Http is not thread-safe, so a request running in a worker thread
+    must not share the service's own connection.
+    
+    Args:
+        service: Authenticated YouTube Data API service
+        
+    Returns:
+        AuthorizedHttp bound to the service's credentials, or None if unavailable
+    """
+    credentials = _service_credentials(service)
+    if credentials is None:
+        return None
+    return build_authorized_http(credentials)
+
+
+def _list_playlist_items(service: Any, playlist_id: str, page_token: Optional[str]) -> Any:
+    """Build the playlistItems.list request for one page."""
+    return service.playlistItems().list(
+        part='snippet,contentDetails',
+        playlistId=playlist_id,
+        maxResults=50,
+        pageToken=page_token,
+        fields=PLAYLIST_ITEMS_FIELDS
+    )
+
+
+def _page_cache_key(playlist_id: str, page_token: Optional[str]) -> str:
+    """Key of one playlist page in the page cache."""
+    return f"{playlist_id}:{page_token or ''}"
+
+
+def _is_quota_exceeded(error: HttpError) -> bool:
+    """Check whether an API error is the daily quota running out."""
+    return error.resp.status == 403 and b'quotaExceeded' in (error.content or b'')
+
+
+def _execute_page(
+    service: Any,
+    playlist_id: str,
+    page_token: Optional[str],
+    page_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    skip_ids: Optional[AbstractSet[str]] = None,
+    http: Optional[Any] = None
+) -> Optional[Dict[str, Any]]:
+    """
+    Fetch one playlistItems page, conditionally if it is in the page cache.
+    
+    A cached page that left out videos which are no longer in skip_ids is
+    fetched unconditionally, since its cached videos are incomplete.
     
     Args:
         service: Authenticated YouTube Data API service
         playlist_id: YouTube playlist ID
+        page_token: Page token, or None for the first page
+        page_cache: Optional page cache holding ETags of earlier fetches
+        skip_ids: Video IDs the fetch leaves out
+        http: Optional HTTP object to execute with (required off the main thread)
         
     Returns:
-        List of video dictionaries with id, title, url, and duration
+        The API response, or None if the cached page is still current (304)
     """
-    logger.info(f"Fetching playlist with ID: {playlist_id}")
+    request = _list_playlist_items(service, playlist_id, page_token)
+    cached = page_cache.get(_page_cache_key(playlist_id, page_token)) if page_cache else None
+    if cached and cached.get('skipped') and not (skip_ids or frozenset()).issuperset(cached['skipped']):
+        cached = None
+    if cached and cached.get('etag'):
+        request.headers['If-None-Match'] = cached['etag']
+    
+    try:
+        return request.execute(http=http, num_retries=API_NUM_RETRIES)
+    except HttpError as e:
+        if cached and e.resp.status == 304:
+            return None
+        raise
+
+
+def _fetch_video_details(
+    service: Any,
+    page_items: List[Dict[str, Any]],
+    http: Optional[Any] = None
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Fetch videos.list details for one page of playlist items.
     
+    Args:
+        service: Authenticated YouTube Data API service
+        page_items: Items of a playlistItems.list response
+        http: Optional HTTP object to execute with (required off the main thread)
+        
+    Returns:
+        Dictionary mapping video ID to its videos.list resource
+    """
+    logger.info("Found %d video IDs in this page", len(page_items))
+    
+    # Fetch video details in batch
+    videos_response = service.videos().list(
+        part='snippet,contentDetails',
+        id=','.join(item['contentDetails']['videoId'] for item in page_items),
+        fields=VIDEOS_FIELDS
+    ).execute(http=http, num_retries=API_NUM_RETRIES)
+    
+    logger.debug("Video details response: %d videos found", len(videos_response.get('items', [])))
+    
+    return {vid['id']: vid for vid in videos_response.get('items', [])}
+
+
+def _build_page_videos(
+    playlist_id: str,
+    page_items: List[Dict[str, Any]],
+    video_details: Dict[str, Dict[str, Any]],
+    first_index: int
+) -> List[Dict[str, Any]]:
+    """
+    Combine one page of playlist items with their details into video entries.
+    
+    Args:
+        playlist_id: YouTube playlist ID
+        page_items: Items of a playlistItems.list response
+        video_details: Details of the page's videos (see _fetch_video_details)
+        first_index: Index to number the videos from if the items carry no
+            snippet.position
+        
+    Returns:
+        List of video dictionaries (items without details are skipped); the
+        index is the item's 1-based position in the playlist, so it stays the
+        same when other items are skipped
+    """
+    if len(video_details) < len(page_items):
+        logger.warning("Only %d out of %d videos had details (some may be private/deleted)",
+                       len(video_details), len(page_items))
+    
+    # Pair items with their details in playlist order (private/deleted videos have none)
+    found = []
+    for item in page_items:
+        video_id = item['contentDetails']['videoId']
+        video_info = video_details.get(video_id)
+        if video_info is None:
+            logger.warning("Video details not found for ID: %s", video_id)
+        else:
+            position = item.get('snippet', {}).get('position')
+            index = position + 1 if position is not None else first_index + len(found)
+            found.append((index, item['id'], video_id, video_info['snippet'], video_info['contentDetails']))
+    
+    # Combine playlist item info with video details
+    return [
+        {
+            'index': index,
+            'id': video_id,
+            'title': snippet.get('title', 'Unknown Title'),
+            'url': WATCH_URL_PREFIX + video_id,
+            # ISO 8601 format: PT1H2M10S
+            'duration': parse_duration(content_details.get('duration', 'PT0S')),
+            'uploader': snippet.get('channelTitle', 'Unknown'),
+            'published_at': snippet.get('publishedAt', ''),
+            'playlist_id': playlist_id,
+            'playlist_item_id': playlist_item_id,
+        }
+        for index, playlist_item_id, video_id, snippet, content_details in found
+    ]
+
+
+def _fetch_playlist_videos(
+    service: Any,
+    playlist_id: str,
+    on_page: Optional[Callable[[List[Dict[str, Any]], Dict[str, Any]], None]] = None,
+    page_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    resume_from: Optional[Dict[str, Any]] = None,
+    skip_ids: Optional[AbstractSet[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch all videos of a playlist with their details.
+    
+    Pages are listed one after another (each needs the previous page's token),
+    while the videos.list detail calls are handed to a pool of DETAIL_WORKERS
+    threads, so pagination never waits for details. Pages are still combined,
+    reported to on_page and cached strictly in playlist order.
+    With a page cache, pages are requested with If-None-Match and unchanged
+    pages (304) are taken from the cache without fetching their details again.
+    
+    Args:
+        service: Authenticated YouTube Data API service
+        playlist_id: YouTube playlist ID
+        on_page: Optional callback receiving each page's videos as soon as they are
+            fetched, and the cursor to resume after that page
+        page_cache: Optional page cache (see load_page_cache), updated in place
+        resume_from: Optional cursor of an aborted fetch; if it belongs to this
+            playlist, fetching continues after the videos it counts
+        skip_ids: Optional video IDs to leave out (e.g. already downloaded);
+            their details are not requested and they are not in the result
+        
+    Returns:
+        List of video dictionaries with id, title, url, and duration (only the
+        newly fetched ones when resuming)
+        
+    Raises:
+        HttpError: If an API request fails
+    """
     videos = []
-    next_page_token = None
+    page_token = None
+    offset = 0
+    seen_keys = set()
+    etags = {}
+    # Listed pages waiting for their details:
+    # (cache key, next token, wanted items or None if cached, skipped IDs, details future)
+    pending = deque()
     
-    try:
+    if resume_from and resume_from.get('playlist_id') == playlist_id and resume_from.get('next_page_token'):
+        page_token = resume_from['next_page_token']
+        offset = resume_from['count']
+        logger.info(f"Resuming interrupted fetch after {offset} videos")
+    from_first_page = page_token is None
+    
+    # Each worker needs its own connection; without one, details are fetched inline
+    use_workers = _service_credentials(service) is not None
+    local = threading.local()
+    
+    def fetch_details_in_worker(page_items: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        if not hasattr(local, 'http'):
+            local.http = _worker_http(service)
+        return _fetch_video_details(service, page_items, local.http)
+    
+    def emit_next_page() -> None:
+        cache_key, next_page_token, page_items, skipped, details = pending.popleft()
+        if page_items is None:
+            cached_page = page_cache[cache_key]
+            logger.info("Page unchanged since last fetch, reusing %d cached videos", len(cached_page['videos']))
+            # Cached videos keep their playlist positions as index
+            page_videos = [
+                dict(video) for video in cached_page['videos']
+                if not skip_ids or video['id'] not in skip_ids
+            ]
+        else:
+            page_videos = _build_page_videos(playlist_id, page_items, details.result(), offset + len(videos) + 1)
+            if page_cache is not None and etags.get(cache_key):
+                page_cache[cache_key] = {
+                    'etag': etags[cache_key],
+                    'next_page_token': next_page_token,
+                    'videos': page_videos,
+                }
+                if skipped:
+                    page_cache[cache_key]['skipped'] = skipped
+        
+        videos.extend(page_videos)
+        if on_page is not None:
+            on_page(page_videos, {
+                'playlist_id': playlist_id,
+                'next_page_token': next_page_token,
+                'count': offset + len(videos),
+            })
+    
+    with ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as executor:
         while True:
-            # Fetch playlist items
-            request = service.playlistItems().list(
-                part='snippet,contentDetails',
-                playlistId=playlist_id,
-                maxResults=50,  # Maximum allowed by API
-                pageToken=next_page_token
-            )
-            
-            response = request.execute()
-            
-            logger.debug(f"API response: {len(response.get('items', []))} items in this page")
+            response = _execute_page(service, playlist_id, page_token, page_cache, skip_ids)
+            cache_key = _page_cache_key(playlist_id, page_token)
+            seen_keys.add(cache_key)
+            page_items = None
+            skipped = []
+            details = None
             
-            if not response.get('items'):
-                total_results = response.get('pageInfo', {}).get('totalResults', 0)
-                if total_results == 0:
-                    logger.warning("Playlist appears to be empty")
-                break
-            
-            # Get video IDs to fetch details
-            video_ids = [item['contentDetails']['videoId'] for item in response['items']]
-            logger.info(f"Found {len(video_ids)} video IDs in this page")
-            
-            # Fetch video details in batch
-            videos_response = service.videos().list(
-                part='snippet,contentDetails,statistics',
-                id=','.join(video_ids)
-            ).execute()
-            
-            logger.debug(f"Video details response: {len(videos_response.get('items', []))} videos found")
-            
-            # Map video details to our format
-            video_details = {
-                vid['id']: vid for vid in videos_response.get('items', [])
-            }
-            
-            if len(video_details) < len(video_ids):
-                logger.warning(f"Only {len(video_details)} out of {len(video_ids)} videos had details (some may be private/deleted)")
-            
-            # Combine playlist item info with video details
-            for idx, item in enumerate(response['items'], start=len(videos) + 1):
-                video_id = item['contentDetails']['videoId']
-                video_info = video_details.get(video_id)
+            if response is None:
+                next_page_token = page_cache[cache_key].get('next_page_token')
+            else:
+                logger.debug("PlaylistItems API response: pageInfo=%s", response.get('pageInfo'))
+                logger.debug("API response: %d items in this page", len(response.get('items', [])))
                 
-                if not video_info:
-                    logger.warning(f"Video details not found for ID: {video_id}")
-                    continue
+                if not response.get('items'):
+                    total_results = response.get('pageInfo', {}).get('totalResults', 0)
+                    if total_results == 0:
+                        logger.warning("Playlist appears to be empty according to API (totalResults=0)")
+                        logger.info("Note: If you see videos in YouTube web interface, they might be in a different playlist or require different permissions")
+                    else:
+                        logger.warning(f"API reports {total_results} total items but returned 0 items - possible API issue")
+                    break
+                next_page_token = response.get('nextPageToken')
+                etags[cache_key] = response.get('etag')
                 
-                # Parse duration (ISO 8601 format: PT1H2M10S)
-                duration_str = video_info['contentDetails'].get('duration', 'PT0S')
-                duration_seconds = parse_duration(duration_str)
+                page_items = response['items']
+                if skip_ids:
+                    skipped = [item['contentDetails']['videoId'] for item in page_items
+                               if item['contentDetails']['videoId'] in skip_ids]
+                    if skipped:
+                        logger.info("Skipping %d already downloaded videos in this page", len(skipped))
+                        page_items = [item for item in page_items
+                                      if item['contentDetails']['videoId'] not in skip_ids]
                 
-                video_data = {
-                    'index': idx,
-                    'id': video_id,
-                    'title': video_info['snippet'].get('title', 'Unknown Title'),
-                    'url': f"https://www.youtube.com/watch?v={video_id}",
-                    'duration': duration_seconds,
-                    'uploader': video_info['snippet'].get('channelTitle', 'Unknown'),
-                    'view_count': int(video_info['statistics'].get('viewCount', 0)),
-                    'published_at': video_info['snippet'].get('publishedAt', ''),
-                }
-                videos.append(video_data)
-                logger.debug(f"Extracted: {video_data['title']}")
+                if use_workers and page_items:
+                    details = executor.submit(fetch_details_in_worker, page_items)
+                else:
+                    details = Future()
+                    details.set_result(_fetch_video_details(service, page_items) if page_items else {})
+            
+            pending.append((cache_key, next_page_token, page_items, skipped, details))
+            
+            # Emit finished pages in order, keeping at most DETAIL_WORKERS in flight
+            while pending and (
+                len(pending) > DETAIL_WORKERS
+                or pending[0][4] is None
+                or pending[0][4].done()
+            ):
+                emit_next_page()
             
             # Check for next page
-            next_page_token = response.get('nextPageToken')
             if not next_page_token:
                 break
             
-            logger.info(f"Fetched {len(videos)} videos so far...")
+            logger.info("Fetched %d videos so far...", offset + len(videos))
+            page_token = next_page_token
+        
+        while pending:
+            emit_next_page()
+    
+    if page_cache is not None and from_first_page:
+        # Drop pages of this playlist that no longer exist
+        prefix = _page_cache_key(playlist_id, None)
+        for key in [key for key in page_cache if key.startswith(prefix) and key not in seen_keys]:
+            del page_cache[key]
+    
+    return videos
+
+
+def fetch_playlist_by_id(
+    service: Any,
+    playlist_id: str,
+    on_page: Optional[Callable[[List[Dict[str, Any]], Dict[str, Any]], None]] = None,
+    page_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    resume_from: Optional[Dict[str, Any]] = None,
+    skip_ids: Optional[AbstractSet[str]] = None
+) -> List[Dict[str, Any]]:
+    """
+    Fetch all videos from any YouTube playlist by ID.
+    
+    Args:
+        service: Authenticated YouTube Data API service
+        playlist_id: YouTube playlist ID
+        on_page: Optional callback receiving each page's videos (e.g. a PlaylistStream)
+        page_cache: Optional page cache for conditional page requests (see load_page_cache)
+        resume_from: Optional cursor of an aborted fetch to continue from (see PlaylistStream)
+        skip_ids: Optional video IDs to leave out without fetching their details
+        
+    Returns:
+        List of video dictionaries with id, title, url, and duration
+    """
+    logger.info(f"Fetching playlist with ID: {playlist_id}")
+    
+    try:
+        videos = _fetch_playlist_videos(service, playlist_id, on_page, page_cache, resume_from, skip_ids)
         
         logger.info(f"Successfully fetched {len(videos)} videos from playlist")
         return videos
         
     except HttpError as e:
         logger.error(f"HTTP error while fetching playlist: {e}")
-        if e.resp.status == 403:
+        if _is_quota_exceeded(e):
+            logger.warning("YouTube API quota exceeded. Pages fetched so far are kept; the next run resumes from there.")
+        elif e.resp.status == 403:
             logger.error("Access forbidden. Check your OAuth scopes and credentials.")
         elif e.resp.status == 404:
             logger.error("Playlist not found. Check the playlist ID.")
@@ -209,11 +556,61 @@ def get_watch_later_playlist_id(service: Any) -> Optional[str]:
     Returns:
         Watch Later playlist ID, or None if not found
     """
+    cache = _service_cache(service)
+    if cache.get('watch_later_id'):
+        return cache['watch_later_id']
+    
+    playlist_id = _resolve_watch_later_playlist_id(service)
+    if playlist_id:
+        cache['watch_later_id'] = playlist_id
+    return playlist_id
+
+
+def _probe_special_watch_later_id(service: Any, http: Optional[Any] = None) -> bool:
+    """
+    Check whether the special Watch Later playlist ID "WL" is accessible.
+    
+    Args:
+        service: Authenticated YouTube Data API service
+        http: Optional HTTP object to execute with (required off the main thread)
+        
+    Returns:
+        True if the "WL" playlist can be read
+    """
+    logger.info("Trying special Watch Later playlist ID: WL")
     try:
-        # Method 1: Try to get from channel's relatedPlaylists
+        service.playlistItems().list(
+            part='id',
+            playlistId='WL',
+            maxResults=1,
+            fields='items/id'
+        ).execute(http=http)
+        logger.info("Successfully accessed Watch Later playlist with ID: WL")
+        return True
+    except HttpError as e:
+        if e.resp.status == 404:
+            logger.warning("Watch Later playlist 'WL' not accessible")
+        else:
+            logger.warning(f"Error accessing 'WL' playlist: {e}")
+        return False
+    except Exception as e:
+        logger.warning(f"Error accessing 'WL' playlist: {e}")
+        return False
+
+
+def _resolve_watch_later_playlist_id(service: Any, probe_wl: bool = True) -> Optional[str]:
+    """Look up the Watch Later playlist ID through the API (uncached)."""
+    try:
+        # Method 1: Watch Later playlist has a special ID "WL"
+        # Try it first: a single cheap probe that succeeds for most accounts
+        if probe_wl and _probe_special_watch_later_id(service):
+            return 'WL'
+        
+        # Method 2: Try to get from channel's relatedPlaylists
         channels_response = service.channels().list(
             part='contentDetails',
-            mine=True
+            mine=True,
+            fields='items/contentDetails/relatedPlaylists'
         ).execute()
         
         if channels_response.get('items'):
@@ -227,33 +624,11 @@ def get_watch_later_playlist_id(service: Any) -> Optional[str]:
                 logger.info(f"Found Watch Later playlist ID from channel: {watch_later_id}")
                 return watch_later_id
         
-        # Method 2: Watch Later playlist has a special ID "WL"
-        # Try to verify it exists by checking if we can access it
-        logger.info("Trying special Watch Later playlist ID: WL")
-        try:
-            test_response = service.playlistItems().list(
-                part='id',
-                playlistId='WL',
-                maxResults=1
-            ).execute()
-            logger.info("Successfully accessed Watch Later playlist with ID: WL")
-            return 'WL'
-        except HttpError as e:
-            if e.resp.status == 404:
-                logger.warning("Watch Later playlist 'WL' not accessible")
-            else:
-                logger.warning(f"Error accessing 'WL' playlist: {e}")
-        
         # Method 3: Search for it in user's playlists
+        # (memoized with the name lookups of this run; stops at the first match)
         logger.info("Searching for Watch Later playlist in user's playlists...")
-        playlists_response = service.playlists().list(
-            part='id,snippet',
-            mine=True,
-            maxResults=50
-        ).execute()
-        
-        for playlist in playlists_response.get('items', []):
-            title = playlist.get('snippet', {}).get('title', '').lower()
+        for playlist in iter_user_playlists(service):
+            title = playlist['title'].lower()
             if 'watch later' in title or playlist['id'] == 'WL':
                 playlist_id = playlist['id']
                 logger.info(f"Found Watch Later playlist: {playlist_id}")
@@ -269,12 +644,18 @@ def get_watch_later_playlist_id(service: Any) -> Optional[str]:
         return None
     except Exception as e:
         logger.error(f"Unexpected error getting Watch Later playlist ID: {e}")
-        import traceback
-        logger.debug(traceback.format_exc())
+        logger.debug("Traceback:", exc_info=True)
         return None
 
 
-def fetch_watch_later_playlist(service: Any, playlist_name: Optional[str] = None) -> List[Dict[str, Any]]:
+def fetch_watch_later_playlist(
+    service: Any,
+    playlist_name: Optional[str] = None,
+    on_page: Optional[Callable[[List[Dict[str, Any]], Dict[str, Any]], None]] = None,
+    page_cache: Optional[Dict[str, Dict[str, Any]]] = None,
+    resume_from: Optional[Dict[str, Any]] = None,
+    skip_ids: Optional[AbstractSet[str]] = None
+) -> List[Dict[str, Any]]:
     """
     Fetch all videos from YouTube Watch Later playlist using YouTube Data API.
     Tries multiple methods to find the Watch Later playlist.
@@ -282,125 +663,74 @@ def fetch_watch_later_playlist(service: Any, playlist_name: Optional[str] = None
     Args:
         service: Authenticated YouTube Data API service
         playlist_name: Optional playlist name to search for (e.g., "Do obejrzenia", "Watch Later")
+        on_page: Optional callback receiving each page's videos (e.g. a PlaylistStream)
+        page_cache: Optional page cache for conditional page requests (see load_page_cache)
+        resume_from: Optional cursor of an aborted fetch to continue from (see PlaylistStream)
+        skip_ids: Optional video IDs to leave out without fetching their details
         
     Returns:
         List of video dictionaries with id, title, url, and duration
     """
     logger.info("Starting to fetch Watch Later playlist...")
     
-    playlist_id = None
+    # Reuse the playlist already resolved for this service, if any
+    playlist_id = _service_cache(service).get('watch_later_id')
     
     # Method 1: Try common Watch Later names first (before trying WL)
-    common_names = ["Do obejrzenia", "Watch Later", "À regarder", "Zu sehen", "Para ver"]
-    if playlist_name:
-        # If specific name provided, try it first
-        common_names.insert(0, playlist_name)
-    
-    for name in common_names:
-        logger.info(f"Trying to find playlist by name: '{name}'")
-        playlist = find_playlist_by_name(service, name)
-        if playlist and playlist['item_count'] > 0:
-            playlist_id = playlist['id']
-            logger.info(f"Found '{playlist['title']}' with {playlist['item_count']} items")
-            break
+    wl_probed = False
+    if not playlist_id:
+        common_names = ["Do obejrzenia", "Watch Later", "À regarder", "Zu sehen", "Para ver"]
+        if playlist_name:
+            # If specific name provided, try it first
+            common_names.insert(0, playlist_name)
+        
+        # Probe the special "WL" ID in the background while the names are
+        # searched; a name match still takes precedence
+        worker_http = _worker_http(service)
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            wl_probe = None
+            if worker_http is not None:
+                wl_probe = executor.submit(_probe_special_watch_later_id, service, worker_http)
+            
+            # List the playlists once and search all names in memory
+            playlists = list_user_playlists(service)
+            for name in common_names:
+                logger.info(f"Trying to find playlist by name: '{name}'")
+                playlist = find_playlist_by_name(service, name, playlists=playlists)
+                if playlist and playlist['item_count'] > 0:
+                    playlist_id = playlist['id']
+                    logger.info(f"Found '{playlist['title']}' with {playlist['item_count']} items")
+                    break
+            
+            if not playlist_id and wl_probe is not None:
+                wl_probed = True
+                if wl_probe.result():
+                    playlist_id = 'WL'
     
     # Method 2: Try to get from channel's relatedPlaylists (WL)
     if not playlist_id:
         logger.info("Trying to get Watch Later from channel's relatedPlaylists...")
-        playlist_id = get_watch_later_playlist_id(service)
+        playlist_id = _resolve_watch_later_playlist_id(service, probe_wl=not wl_probed)
     
     if not playlist_id:
         logger.error("Could not retrieve Watch Later playlist ID")
         logger.info("Try using --playlist-name or --playlist-id to specify a playlist")
         return []
     
-    videos = []
-    next_page_token = None
+    # Later removals (auto-clean) target the same playlist without re-resolving it
+    _service_cache(service)['watch_later_id'] = playlist_id
     
     try:
-        while True:
-            # Fetch playlist items
-            request = service.playlistItems().list(
-                part='snippet,contentDetails',
-                playlistId=playlist_id,
-                maxResults=50,  # Maximum allowed by API
-                pageToken=next_page_token
-            )
-            
-            response = request.execute()
-            
-            # Log full response for debugging
-            logger.info(f"PlaylistItems API response: pageInfo={response.get('pageInfo')}, totalResults={response.get('pageInfo', {}).get('totalResults', 'N/A')}")
-            logger.debug(f"API response: {len(response.get('items', []))} items in this page")
-            
-            if not response.get('items'):
-                total_results = response.get('pageInfo', {}).get('totalResults', 0)
-                if total_results == 0:
-                    logger.warning("Playlist appears to be empty according to API (totalResults=0)")
-                    logger.info("Note: If you see videos in YouTube web interface, they might be in a different playlist or require different permissions")
-                else:
-                    logger.warning(f"API reports {total_results} total items but returned 0 items - possible API issue")
-                break
-            
-            # Get video IDs to fetch details
-            video_ids = [item['contentDetails']['videoId'] for item in response['items']]
-            logger.info(f"Found {len(video_ids)} video IDs in this page")
-            
-            # Fetch video details in batch
-            videos_response = service.videos().list(
-                part='snippet,contentDetails,statistics',
-                id=','.join(video_ids)
-            ).execute()
-            
-            logger.debug(f"Video details response: {len(videos_response.get('items', []))} videos found")
-            
-            # Map video details to our format
-            video_details = {
-                vid['id']: vid for vid in videos_response.get('items', [])
-            }
-            
-            if len(video_details) < len(video_ids):
-                logger.warning(f"Only {len(video_details)} out of {len(video_ids)} videos had details (some may be private/deleted)")
-            
-            # Combine playlist item info with video details
-            for idx, item in enumerate(response['items'], start=len(videos) + 1):
-                video_id = item['contentDetails']['videoId']
-                video_info = video_details.get(video_id)
-                
-                if not video_info:
-                    logger.warning(f"Video details not found for ID: {video_id}")
-                    continue
-                
-                # Parse duration (ISO 8601 format: PT1H2M10S)
-                duration_str = video_info['contentDetails'].get('duration', 'PT0S')
-                duration_seconds = parse_duration(duration_str)
-                
-                video_data = {
-                    'index': idx,
-                    'id': video_id,
-                    'title': video_info['snippet'].get('title', 'Unknown Title'),
-                    'url': f"https://www.youtube.com/watch?v={video_id}",
-                    'duration': duration_seconds,
-                    'uploader': video_info['snippet'].get('channelTitle', 'Unknown'),
-                    'view_count': int(video_info['statistics'].get('viewCount', 0)),
-                    'published_at': video_info['snippet'].get('publishedAt', ''),
-                }
-                videos.append(video_data)
-                logger.debug(f"Extracted: {video_data['title']}")
-            
-            # Check for next page
-            next_page_token = response.get('nextPageToken')
-            if not next_page_token:
-                break
-            
-            logger.info(f"Fetched {len(videos)} videos so far...")
+        videos = _fetch_playlist_videos(service, playlist_id, on_page, page_cache, resume_from, skip_ids)
         
         logger.info(f"Successfully fetched {len(videos)} videos from Watch Later playlist")
         return videos
         
     except HttpError as e:
         logger.error(f"HTTP error while fetching playlist: {e}")
-        if e.resp.status == 403:
+        if _is_quota_exceeded(e):
+            logger.warning("YouTube API quota exceeded. Pages fetched so far are kept; the next run resumes from there.")
+        elif e.resp.status == 403:
             logger.error("Access forbidden. Check your OAuth scopes and credentials.")
         elif e.resp.status == 401:
             logger.error("Authentication failed. Please re-authenticate.")
@@ -420,24 +750,54 @@ def parse_duration(duration_str: str) -> int:
     Returns:
         Duration in seconds
     """
-    # Remove PT prefix
-    duration_str = duration_str.replace('PT', '')
+    # Single pass: accumulate digits, apply the unit letter that follows them.
+    # 'P' and 'T' are designators without a number and just reset the count.
+    total = 0
+    number = 0
+    for char in duration_str:
+        if '0' <= char <= '9':
+            number = number * 10 + (ord(char) - 48)
+        else:
+            total += number * _DURATION_UNITS.get(char, 0)
+            number = 0
     
-    # Extract hours, minutes, seconds
-    hours_match = re.search(r'(\d+)H', duration_str)
-    minutes_match = re.search(r'(\d+)M', duration_str)
-    seconds_match = re.search(r'(\d+)S', duration_str)
-    
-    hours = int(hours_match.group(1)) if hours_match else 0
-    minutes = int(minutes_match.group(1)) if minutes_match else 0
-    seconds = int(seconds_match.group(1)) if seconds_match else 0
+    return total
+
+
+def remove_playlist_item(
+    service: Any,
+    playlist_item_id: str,
+    http: Optional[Any] = None
+) -> bool:
+    """
+    Remove an item from a playlist by its playlist item ID (no lookup needed).
     
-    return hours * 3600 + minutes * 60 + seconds
+    Args:
+        service: Authenticated YouTube Data API service
+        playlist_item_id: ID of the playlist item (not the video ID)
+        http: Optional HTTP object to execute with (required off the main thread)
+        
+    Returns:
+        True if successful, False otherwise
+    """
+    try:
+        service.playlistItems().delete(id=playlist_item_id).execute(http=http)
+        # Cached item counts are stale now
+        _service_cache(service).pop('playlists', None)
+        logger.info(f"Removed playlist item {playlist_item_id}")
+        return True
+    except HttpError as e:
+        logger.error(f"Error removing playlist item {playlist_item_id}: {e}")
+        return False
+    except Exception as e:
+        logger.error(f"Unexpected error: {e}")
+        return False
 
 
 def remove_video_from_watch_later(
     service: Any,
-    video_id: str
+    video_id: str,
+    http: Optional[Any] = None
 ) -> bool:
     """
     Remove a video from Watch Later playlist.
@@ -445,6 +805,7 @@ def remove_video_from_watch_later(
     Args:
         service: Authenticated YouTube Data API service
         video_id: YouTube video ID to remove
+        http: Optional HTTP object to execute with (required off the main thread)
         
     Returns:
         True if successful, False otherwise
@@ -461,10 +822,11 @@ def remove_video_from_watch_later(
             part='id',
             playlistId=playlist_id,
             videoId=video_id,
-            maxResults=1
+            maxResults=1,
+            fields='items/id'
         )
         
-        response = request.execute()
+        response = request.execute(http=http)
         
         if not response.get('items'):
             logger.warning(f"Video {video_id} not found in Watch Later playlist")
@@ -473,7 +835,9 @@ def remove_video_from_watch_later(
         playlist_item_id = response['items'][0]['id']
         
         # Delete the playlist item
-        service.playlistItems().delete(id=playlist_item_id).execute()
+        service.playlistItems().delete(id=playlist_item_id).execute(http=http)
+        # Cached item counts are stale now
+        _service_cache(service).pop('playlists', None)
         
         logger.info(f"Removed video {video_id} from Watch Later playlist")
         return True
@@ -484,3 +848,164 @@ def remove_video_from_watch_later(
     except Exception as e:
         logger.error(f"Unexpected error: {e}")
         return False
+
+
+def execute_batched(service: Any, requests: Dict[str, Any]) -> Dict[str, Tuple[Any, Optional[Exception]]]:
+    """
+    Execute API requests as BatchHttpRequests of up to BATCH_SIZE sub-requests.
+    
+    A failing sub-request does not fail the others; its exception is returned
+    in its place.
+    
+    Args:
+        service: Authenticated YouTube Data API service
+        requests: Mapping of request ID to request
+        
+    Returns:
+        Dictionary mapping request ID to (response, exception)
+    """
+    results = {}
+    
+    def _collect(request_id, response, exception):
+        results[request_id] = (response, exception)
+    
+    request_ids = list(requests)
+    for start in range(0, len(request_ids), BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_collect)
+        for request_id in request_ids[start:start + BATCH_SIZE]:
+            batch.add(requests[request_id], request_id=request_id)
+        batch.execute()
+    return results
+
+
+def _remove_batched(
+    service: Any,
+    video_ids: List[str],
+    playlist_item_ids: Dict[str, str],
+    removed: Set[str]
+) -> None:
+    """
+    Remove videos from Watch Later with batched lookups and deletes.
+    
+    Args:
+        service: Authenticated YouTube Data API service
+        video_ids: YouTube video IDs to remove
+        playlist_item_ids: Known playlist item IDs by video ID
+        removed: Set the IDs of removed videos are added to
+    """
+    item_ids = {video_id: playlist_item_ids[video_id] for video_id in video_ids if video_id in playlist_item_ids}
+    
+    # Look up the playlist items of the remaining videos
+    unknown = [video_id for video_id in video_ids if video_id not in item_ids]
+    if unknown:
+        playlist_id = get_watch_later_playlist_id(service)
+        if not playlist_id:
+            logger.error("Could not retrieve Watch Later playlist ID")
+        else:
+            lookups = execute_batched(service, {
+                video_id: service.playlistItems().list(
+                    part='id',
+                    playlistId=playlist_id,
+                    videoId=video_id,
+                    maxResults=1,
+                    fields='items/id'
+                )
+                for video_id in unknown
+            })
+            for video_id, (response, exception) in lookups.items():
+                if exception is not None:
+                    logger.error(f"Error looking up video {video_id} in Watch Later: {exception}")
+                elif not response.get('items'):
+                    logger.warning(f"Video {video_id} not found in Watch Later playlist")
+                else:
+                    item_ids[video_id] = response['items'][0]['id']
+    
+    deletes = execute_batched(service, {
+        video_id: service.playlistItems().delete(id=item_id)
+        for video_id, item_id in item_ids.items()
+        if video_id not in removed
+    })
+    for video_id, (response, exception) in deletes.items():
+        if exception is not None:
+            logger.error(f"Error removing video {video_id} from Watch Later: {exception}")
+        else:
+            removed.add(video_id)
+            logger.info(f"Removed video {video_id} from Watch Later playlist")
+    
+    if removed:
+        # Cached item counts are stale now
+        _service_cache(service).pop('playlists', None)
+
+
+def remove_videos_from_watch_later(
+    service: Any,
+    video_ids: List[str],
+    playlist_item_ids: Optional[Dict[str, str]] = None,
+    max_workers: int = 4
+) -> int:
+    """
+    Remove several videos from Watch Later playlist.
+    
+    Playlist item lookups and deletes are sent as BatchHttpRequests, so N
+    removals take a couple of round trips instead of up to 2N. If a batch
+    fails as a whole, the remaining videos are removed one by one, with at
+    most ``max_workers`` requests in flight (each worker thread executes on
+    its own authorized HTTP object).
+    
+    Args:
+        service: Authenticated YouTube Data API service
+        video_ids: YouTube video IDs to remove
+        playlist_item_ids: Optional mapping of video ID to Watch Later playlist
+            item ID; mapped videos are deleted without a lookup
+        max_workers: Maximum number of concurrent removals in the fallback
+        
+    Returns:
+        Number of videos removed
+    """
+    if not video_ids:
+        return 0
+    playlist_item_ids = playlist_item_ids or {}
+    
+    removed: Set[str] = set()
+    try:
+        _remove_batched(service, video_ids, playlist_item_ids, removed)
+        return len(removed)
+    except Exception as e:
+        logger.warning(f"Batched removal failed, removing videos one by one: {e}")
+    
+    video_ids = [video_id for video_id in video_ids if video_id not in removed]
+    return len(removed) + _remove_concurrently(service, video_ids, playlist_item_ids, max_workers)
+
+
+def _remove_concurrently(
+    service: Any,
+    video_ids: List[str],
+    playlist_item_ids: Dict[str, str],
+    max_workers: int
+) -> int:
+    """Remove videos from Watch Later one request at a time, on a bounded thread pool."""
+    if not video_ids:
+        return 0
+    
+    # Resolve (and cache) the playlist ID on the main thread before fanning out
+    if any(video_id not in playlist_item_ids for video_id in video_ids):
+        get_watch_later_playlist_id(service)
+    
+    def remove(video_id: str, http: Optional[Any] = None) -> bool:
+        if video_id in playlist_item_ids:
+            return remove_playlist_item(service, playlist_item_ids[video_id], http=http)
+        return remove_video_from_watch_later(service, video_id, http=http)
+    
+    # Without credentials for private connections, stay on the shared one
+    if max_workers <= 1 or len(video_ids) == 1 or _service_credentials(service) is None:
+        return sum(remove(video_id) for video_id in video_ids)
+    
+    local = threading.local()
+    
+    def remove_in_worker(video_id: str) -> bool:
+        if not hasattr(local, 'http'):
+            local.http = _worker_http(service)
+        return remove(video_id, http=local.http)
+    
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(video_ids))) as executor:
+        return sum(executor.map(remove_in_worker, video_ids))
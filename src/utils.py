@@ -1,31 +1,60 @@
 """Utility functions for the YouTube Watch Later downloader."""
 import os
-import re
 import json
 import logging
 from pathlib import Path
 from datetime import datetime
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, FrozenSet, Iterator, Tuple
 import threading
+import time
+import atexit
 
-_tracker_lock = threading.Lock()
+try:
+    import orjson
+except ImportError:  # optional speedup, stdlib json is used otherwise
+    orjson = None
 
+# One lock per tracker file (by real path), so separate trackers don't contend
+_tracker_locks: Dict[str, threading.Lock] = {}
+_tracker_locks_guard = threading.Lock()
 
-def sanitize_filename(filename: str, max_length: int = 200) -> str:
+# tracker_file -> ((st_mtime_ns, st_size), parsed tracker, downloaded video IDs)
+_tracker_cache: Dict[str, Tuple[Tuple[int, int], Dict[str, Dict[str, Any]], FrozenSet[str]]] = {}
+
+# Write-behind buffer: tracker_file -> {video_id: entry} not yet written to disk
+_pending_marks: Dict[str, Dict[str, Dict[str, Any]]] = {}
+_last_flush: Dict[str, float] = {}
+
+# Flush the tracker after this many new entries or this many seconds
+TRACKER_FLUSH_EVERY = 16
+TRACKER_FLUSH_SECONDS = 5.0
+
+# File handler installed by setup_logging, if any
+_log_file_handler: Optional[logging.FileHandler] = None
+
+# Read buffer for line-by-line scans of the playlist stream
+IO_BUFFER_SIZE = 64 * 1024
+
+# Characters that are invalid in filenames (Windows-reserved + control chars) -> '_'
+_SANITIZE_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*' + ''.join(map(chr, range(0x20)))})
+
+
+def sanitize_filename(filename: str, max_length: int = 200, max_bytes: int = 200) -> str:
     """
     Sanitize a filename by removing invalid characters and limiting length.
     
     Args:
         filename: The original filename
-        max_length: Maximum length for the filename
+        max_length: Maximum length for the filename in characters
+        max_bytes: Maximum length for the filename in UTF-8 bytes, since
+            filesystems limit names by bytes (usually 255) rather than characters
         
     Returns:
         Sanitized filename safe for filesystem
     """
     # Remove invalid characters for filenames
-    invalid_chars = r'[<>:"/\\|?*\x00-\x1f]'
-    sanitized = re.sub(invalid_chars, '_', filename)
+    sanitized = filename.translate(_SANITIZE_TABLE)
     
     # Remove leading/trailing spaces and dots
     sanitized = sanitized.strip(' .')
@@ -34,6 +63,16 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     if len(sanitized) > max_length:
         sanitized = sanitized[:max_length]
     
+    # Limit size on disk; ASCII names are one byte per character
+    if sanitized.isascii():
+        if len(sanitized) > max_bytes:
+            sanitized = sanitized[:max_bytes]
+    else:
+        encoded = sanitized.encode('utf-8')
+        if len(encoded) > max_bytes:
+            # Drop a multi-byte character cut in half at the end
+            sanitized = encoded[:max_bytes].decode('utf-8', errors='ignore').rstrip(' .')
+    
     # Ensure it's not empty
     if not sanitized:
         sanitized = "video"
@@ -41,29 +80,62 @@ def sanitize_filename(filename: str, max_length: int = 200) -> str:
     return sanitized
 
 
+def _json_loads(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data.decode('utf-8'))
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
 def setup_logging(log_file: str) -> logging.Logger:
     """
     Set up logging to both file and console.
     
+    Calling it again with the same log file is a no-op; with a different one
+    only the file handler is swapped. Handlers configured outside this module
+    are left alone.
+    
     Args:
         log_file: Path to the log file
         
     Returns:
         Configured logger instance
     """
+    global _log_file_handler
+    
+    root_logger = logging.getLogger()
+    if _log_file_handler is None and root_logger.handlers:
+        return logging.getLogger(__name__)
+    if _log_file_handler is not None and _log_file_handler.baseFilename == os.path.abspath(log_file):
+        return logging.getLogger(__name__)
+    
     # Create log directory if it doesn't exist
     log_path = Path(log_file)
     log_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Configure logging
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file, encoding='utf-8'),
-            logging.StreamHandler()
-        ]
-    )
+    # Configure logging; the log file is only opened on the first record
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    file_handler = logging.FileHandler(log_file, encoding='utf-8', delay=True)
+    file_handler.setFormatter(formatter)
+    
+    if _log_file_handler is not None:
+        root_logger.removeHandler(_log_file_handler)
+        _log_file_handler.close()
+    else:
+        console_handler = logging.StreamHandler()
+        console_handler.setFormatter(formatter)
+        root_logger.addHandler(console_handler)
+        root_logger.setLevel(logging.INFO)
+    
+    root_logger.addHandler(file_handler)
+    _log_file_handler = file_handler
     
     return logging.getLogger(__name__)
 
@@ -83,8 +155,8 @@ def load_config(config_path: str = "./config/settings.json") -> Dict[str, Any]:
     if not config_file.exists():
         raise FileNotFoundError(f"Configuration file not found: {config_path}")
     
-    with open(config_file, 'r', encoding='utf-8') as f:
-        config = json.load(f)
+    with open(config_file, 'rb') as f:
+        config = _json_loads(f.read())
     
     # Expand user path for download_path
     if 'download_path' in config:
@@ -98,22 +170,133 @@ def load_config(config_path: str = "./config/settings.json") -> Dict[str, Any]:
 
 def save_playlist_data(playlist_data: list, data_file: str) -> None:
     """
-    Save playlist data to JSON file.
+    Save playlist data to a JSON Lines file (one video per line).
     
     Args:
         playlist_data: List of video dictionaries
         data_file: Path to save the data
     """
+    stream = PlaylistStream(data_file)
+    stream(playlist_data)
+    stream.commit()
+
+
+class PlaylistStream:
+    """
+    Write fetched videos to the playlist data file page by page.
+    
+    Videos are appended as JSON Lines to "<data_file>.partial" as soon as each
+    page arrives, so an interrupted fetch keeps what it already got and memory
+    for serialization stays at one page. commit() atomically moves the partial
+    file over the data file; until then the previous data file is untouched.
+    
+    A page written with a cursor (where the fetch stopped) also records it in
+    "<data_file>.cursor". With resume=True, a stream opened after an aborted
+    fetch (e.g. API quota exhausted) exposes that cursor as resume_from, so the
+    fetch can continue after the pages already on disk.
+    """
+    
+    def __init__(self, data_file: str, resume: bool = False):
+        self.data_file = Path(data_file)
+        self.partial_file = Path(str(data_file) + '.partial')
+        self.cursor_file = Path(str(data_file) + '.cursor')
+        self.data_file.parent.mkdir(parents=True, exist_ok=True)
+        self.count = 0
+        # Pages received by this stream (including ones with no videos)
+        self.pages = 0
+        self.resume_from: Optional[Dict[str, Any]] = None
+        
+        if resume and self.partial_file.exists() and self.cursor_file.exists():
+            try:
+                with open(self.cursor_file, 'rb') as f:
+                    cursor = _json_loads(f.read())
+                # Cut off a page appended after the cursor was last written
+                with open(self.partial_file, 'r+b') as f:
+                    f.truncate(cursor['size'])
+                self.count = cursor['count']
+                self.resume_from = cursor
+                return
+            except Exception as e:
+                logging.getLogger(__name__).warning(f"Ignoring unusable fetch cursor: {e}")
+        
+        # Drop leftovers of an earlier interrupted fetch
+        for leftover in (self.partial_file, self.cursor_file):
+            if leftover.exists():
+                leftover.unlink()
+    
+    def __call__(self, videos: list, cursor: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Append one page of video dictionaries.
+        
+        Args:
+            videos: Video dictionaries of the page
+            cursor: Optional fetch position after this page, with 'playlist_id',
+                'next_page_token' and 'count' (videos fetched including this page)
+        """
+        mode = 'ab'
+        if cursor is not None and cursor['count'] - len(videos) != self.count:
+            # The fetch did not continue from what is on disk: start over
+            mode = 'wb'
+            self.count = 0
+        
+        with open(self.partial_file, mode) as f:
+            f.write(b''.join(_json_dumps(video) + b'\n' for video in videos))
+            size = f.tell()
+        self.count += len(videos)
+        self.pages += 1
+        
+        if cursor is not None and cursor.get('next_page_token'):
+            temp_file = Path(str(self.cursor_file) + '.tmp')
+            with open(temp_file, 'wb') as f:
+                f.write(_json_dumps(dict(cursor, size=size)))
+            os.replace(temp_file, self.cursor_file)
+    
+    def commit(self) -> None:
+        """Replace the data file with everything written so far."""
+        if not self.partial_file.exists():
+            # Nothing was written: store an empty playlist
+            self.partial_file.touch()
+        os.replace(self.partial_file, self.data_file)
+        if self.cursor_file.exists():
+            self.cursor_file.unlink()
+
+
+def iter_playlist_data(data_file: str) -> Iterator[Dict[str, Any]]:
+    """
+    Iterate over the videos in a playlist data file without loading it whole.
+    
+    Reads the JSON Lines format one line at a time; files written by older
+    versions as a single JSON array are still accepted (parsed in one go).
+    
+    Args:
+        data_file: Path to the data file
+        
+    Yields:
+        Video dictionaries in playlist order (nothing if the file doesn't exist)
+    """
     data_path = Path(data_file)
-    data_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(data_path, 'w', encoding='utf-8') as f:
-        json.dump(playlist_data, f, indent=2, ensure_ascii=False)
+    if not data_path.exists():
+        return
+    
+    with open(data_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        first_char = f.read(1)
+        while first_char.isspace():
+            first_char = f.read(1)
+        f.seek(0)
+        
+        if first_char == b'[':
+            # Legacy format: one JSON array
+            yield from _json_loads(f.read())
+            return
+        for line in f:
+            if line.strip():
+                yield _json_loads(line)
 
 
 def load_playlist_data(data_file: str) -> list:
     """
-    Load playlist data from JSON file.
+    Load playlist data from file.
     
     Args:
         data_file: Path to the data file
@@ -121,13 +304,46 @@ def load_playlist_data(data_file: str) -> list:
     Returns:
         List of video dictionaries, or empty list if file doesn't exist
     """
-    data_path = Path(data_file)
+    return list(iter_playlist_data(data_file))
+
+
+def load_page_cache(cache_file: str) -> Dict[str, Dict[str, Any]]:
+    """
+    Load the playlist page cache (ETags and videos of previously fetched pages).
     
-    if not data_path.exists():
-        return []
+    Args:
+        cache_file: Path to the page cache JSON file
+        
+    Returns:
+        Dictionary mapping page key to cached page, or empty dict if unavailable
+    """
+    cache_path = Path(cache_file)
+    if not cache_path.exists():
+        return {}
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            return _json_loads(f.read())
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Error loading page cache: {e}")
+        return {}
+
+
+def save_page_cache(cache: Dict[str, Dict[str, Any]], cache_file: str) -> None:
+    """
+    Save the playlist page cache.
+    
+    Args:
+        cache: Dictionary mapping page key to cached page
+        cache_file: Path to the page cache JSON file
+    """
+    cache_path = Path(cache_file)
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
     
-    with open(data_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+    temp_file = cache_path.with_suffix('.tmp')
+    with open(temp_file, 'wb') as f:
+        f.write(_json_dumps(cache))
+    os.replace(temp_file, cache_path)
 
 
 def load_download_tracker(tracker_file: str) -> Dict[str, Dict[str, Any]]:
@@ -140,18 +356,28 @@ def load_download_tracker(tracker_file: str) -> Dict[str, Dict[str, Any]]:
     Returns:
         Dictionary mapping video_id to download info
     """
-    tracker_path = Path(tracker_file)
-    if not tracker_path.exists():
-        return {}
-    
     try:
-        with open(tracker_path, 'r', encoding='utf-8') as f:
-            return json.load(f)
+        with open(tracker_file, 'rb') as f:
+            return _json_loads(f.read())
+    except FileNotFoundError:
+        return {}
     except Exception as e:
         logging.getLogger(__name__).warning(f"Error loading download tracker: {e}")
         return {}
 
 
+def _fsync_dir(directory: str) -> None:
+    """Flush a directory entry (e.g. a rename) to disk; a no-op where unsupported."""
+    if not hasattr(os, 'O_DIRECTORY'):
+        return  # Windows has no directory file descriptors
+    
+    dir_fd = os.open(directory or os.curdir, os.O_RDONLY | os.O_DIRECTORY)
+    try:
+        os.fsync(dir_fd)
+    finally:
+        os.close(dir_fd)
+
+
 def save_download_tracker(tracker: Dict[str, Dict[str, Any]], tracker_file: str) -> None:
     """
     Save the download tracker database.
@@ -160,26 +386,41 @@ def save_download_tracker(tracker: Dict[str, Dict[str, Any]], tracker_file: str)
         tracker: Dictionary mapping video_id to download info
         tracker_file: Path to the tracker JSON file
     """
-    tracker_path = Path(tracker_file)
-    tracker_path.parent.mkdir(parents=True, exist_ok=True)
+    # Plain os.path here: this runs on every tracker flush
+    tracker_dir = os.path.dirname(tracker_file)
+    if tracker_dir:
+        os.makedirs(tracker_dir, exist_ok=True)
     
     # Atomic write: write to temp file then rename with os.replace
     # This prevents the file from being empty/corrupt if the process crashes during write
     # or if another process reads it while it's being written
-    temp_file = tracker_path.with_suffix('.tmp')
+    temp_file = os.path.splitext(tracker_file)[0] + '.tmp'
     try:
-        with open(temp_file, 'w', encoding='utf-8') as f:
-            json.dump(tracker, f, indent=2, ensure_ascii=False)
-        os.replace(temp_file, tracker_path)
+        with open(temp_file, 'wb') as f:
+            f.write(_json_dumps(tracker))
+            # Make sure the data is on disk before the rename is
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, tracker_file)
+        _fsync_dir(tracker_dir)
     except Exception as e:
-        if temp_file.exists():
-            try:
-                os.remove(temp_file)
-            except OSError:
-                pass
+        try:
+            os.remove(temp_file)
+        except OSError:
+            pass
         raise e
 
 
+def _tracker_lock(tracker_file: str) -> threading.Lock:
+    """Get the lock guarding the buffer and writes of one tracker file."""
+    key = os.path.realpath(tracker_file)
+    lock = _tracker_locks.get(key)
+    if lock is None:
+        with _tracker_locks_guard:
+            lock = _tracker_locks.setdefault(key, threading.Lock())
+    return lock
+
+
 def mark_video_downloaded(
     video_id: str,
     video_title: str,
@@ -190,6 +431,9 @@ def mark_video_downloaded(
     """
     Mark a video as downloaded in the tracker.
     
+    Entries are buffered and written in batches (see TRACKER_FLUSH_EVERY and
+    TRACKER_FLUSH_SECONDS); call flush_download_tracker() to force a write.
+    
     Args:
         video_id: YouTube video ID
         video_title: Video title
@@ -197,10 +441,9 @@ def mark_video_downloaded(
         tracker_file: Path to the tracker JSON file
         file_size: Optional file size in bytes
     """
-    with _tracker_lock:
-        tracker = load_download_tracker(tracker_file)
-        
-        tracker[video_id] = {
+    with _tracker_lock(tracker_file):
+        pending = _pending_marks.setdefault(tracker_file, {})
+        pending[video_id] = {
             'video_id': video_id,
             'title': video_title,
             'filepath': filepath,
@@ -209,7 +452,106 @@ def mark_video_downloaded(
             'status': 'downloaded'
         }
         
+        if (len(pending) >= TRACKER_FLUSH_EVERY
+                or time.monotonic() - _last_flush.get(tracker_file, 0.0) >= TRACKER_FLUSH_SECONDS):
+            _flush_tracker_locked(tracker_file)
+
+
+def _flush_tracker_locked(tracker_file: str) -> None:
+    """Write buffered entries of one tracker to disk. Caller must hold _tracker_lock(tracker_file)."""
+    pending = _pending_marks.pop(tracker_file, None)
+    if not pending:
+        return
+    
+    try:
+        # The in-memory tracker is reused unless the file changed on disk
+        tracker = _get_tracker(tracker_file)
+        tracker.update(pending)
         save_download_tracker(tracker, tracker_file)
+    except Exception:
+        # Keep the entries so the next flush can retry
+        _pending_marks.setdefault(tracker_file, {}).update(pending)
+        _tracker_cache.pop(tracker_file, None)
+        raise
+    
+    _cache_tracker(tracker_file, tracker)
+    _last_flush[tracker_file] = time.monotonic()
+
+
+def flush_download_tracker(tracker_file: Optional[str] = None) -> None:
+    """
+    Write buffered tracker entries to disk.
+    
+    Args:
+        tracker_file: Tracker to flush, or None to flush all of them
+    """
+    tracker_files = [tracker_file] if tracker_file else list(_pending_marks)
+    for path in tracker_files:
+        with _tracker_lock(path):
+            _flush_tracker_locked(path)
+
+
+@atexit.register
+def _flush_trackers_at_exit() -> None:
+    try:
+        flush_download_tracker()
+    except Exception as e:
+        logging.getLogger(__name__).warning(f"Could not save download tracker: {e}")
+
+
+def _tracker_stamp(tracker_file: str) -> Optional[Tuple[int, int]]:
+    """Return (mtime_ns, size) of the tracker file, or None if it doesn't exist."""
+    try:
+        st = os.stat(tracker_file)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cache_tracker(
+    tracker_file: str,
+    tracker: Dict[str, Dict[str, Any]]
+) -> Tuple[Dict[str, Dict[str, Any]], FrozenSet[str]]:
+    """Store a freshly loaded or written tracker and its downloaded IDs in the cache."""
+    downloaded = frozenset(
+        video_id for video_id, info in tracker.items()
+        if info.get('status') == 'downloaded'
+    )
+    stamp = _tracker_stamp(tracker_file)
+    if stamp is not None:
+        _tracker_cache[tracker_file] = (stamp, tracker, downloaded)
+    return tracker, downloaded
+
+
+def _load_tracker_cached(tracker_file: str) -> Tuple[Dict[str, Dict[str, Any]], FrozenSet[str]]:
+    """
+    Get the tracker and its downloaded video IDs, parsing it only when it changed on disk.
+    
+    Args:
+        tracker_file: Path to the tracker JSON file
+        
+    Returns:
+        Tuple of (tracker dictionary, frozen set of video IDs marked as downloaded)
+    """
+    stamp = _tracker_stamp(tracker_file)
+    if stamp is None:
+        return {}, frozenset()
+    
+    cached = _tracker_cache.get(tracker_file)
+    if cached and cached[0] == stamp:
+        return cached[1], cached[2]
+    
+    return _cache_tracker(tracker_file, load_download_tracker(tracker_file))
+
+
+def _get_tracker(tracker_file: str) -> Dict[str, Dict[str, Any]]:
+    """Get the (cached) tracker dictionary; see _load_tracker_cached."""
+    return _load_tracker_cached(tracker_file)[0]
+
+
+def _get_downloaded_ids(tracker_file: str) -> FrozenSet[str]:
+    """Get the (cached) downloaded video IDs; see _load_tracker_cached."""
+    return _load_tracker_cached(tracker_file)[1]
 
 
 def is_video_downloaded(video_id: str, tracker_file: str) -> bool:
@@ -223,48 +565,27 @@ def is_video_downloaded(video_id: str, tracker_file: str) -> bool:
     Returns:
         True if video is in tracker, False otherwise
     """
-    tracker = load_download_tracker(tracker_file)
-    return video_id in tracker and tracker[video_id].get('status') == 'downloaded'
+    return video_id in _get_downloaded_ids(tracker_file) or video_id in _pending_marks.get(tracker_file, ())
 
 
-def get_downloaded_videos(tracker_file: str, download_path: Optional[str] = None) -> set:
+def get_downloaded_videos(tracker_file: str) -> set:
     """
     Get set of already downloaded video IDs from the tracker.
-    Optionally also checks local files for backwards compatibility.
     
     Args:
         tracker_file: Path to the tracker JSON file
-        download_path: Optional path to downloads directory (for backwards compatibility)
         
     Returns:
         Set of video IDs that have been downloaded
     """
-    tracker = load_download_tracker(tracker_file)
-    downloaded = set()
-    
-    # Get from tracker
-    for video_id, info in tracker.items():
-        if info.get('status') == 'downloaded':
-            downloaded.add(video_id)
-    
-    # Also check local files for backwards compatibility (if download_path provided)
-    if download_path:
-        download_dir = Path(download_path)
-        if download_dir.exists():
-            for file in download_dir.glob("*.mp4"):
-                filename = file.stem
-                # Try to find YouTube video ID pattern (11 characters)
-                video_id_match = re.search(r'([a-zA-Z0-9_-]{11})$', filename)
-                if video_id_match:
-                    video_id = video_id_match.group(1)
-                    if video_id not in downloaded:
-                        # Found a file that's not in tracker - add it
-                        downloaded.add(video_id)
-                        # Optionally update tracker (but we don't have title info here)
-    
+    downloaded = set(_get_downloaded_ids(tracker_file))
+    downloaded.update(_pending_marks.get(tracker_file, ()))
     return downloaded
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB', 'PB')
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     Format file size in human-readable format.
@@ -275,10 +596,11 @@ def format_file_size(size_bytes: int) -> str:
     Returns:
         Formatted string (e.g., "1.5 MB")
     """
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if size_bytes < 1024.0:
-            return f"{size_bytes:.2f} {unit}"
-        size_bytes /= 1024.0
-    return f"{size_bytes:.2f} PB"
+    if size_bytes < 1024:
+        return f"{size_bytes:.2f} B"
+    
+    # Each unit is 2**10 times the previous one, so the bit length picks it directly
+    index = min((int(size_bytes).bit_length() - 1) // 10, len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (index * 10)):.2f} {_SIZE_UNITS[index]}"
 
 
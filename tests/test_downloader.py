@@ -0,0 +1,82 @@
+"""Tests for the yt-dlp progress hook dispatch in downloader.py."""
+import logging
+import sys
+import threading
+import types
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+# yt-dlp is only needed for its YoutubeDL class, which the tests replace
+if 'yt_dlp' not in sys.modules:
+    try:
+        import yt_dlp  # noqa: F401
+    except ImportError:
+        sys.modules['yt_dlp'] = types.SimpleNamespace(YoutubeDL=object)
+
+import downloader
+
+
+class FakeYoutubeDL:
+    """Stand-in for yt_dlp.YoutubeDL that only keeps its params."""
+    
+    def __init__(self, params):
+        self.params = dict(params, outtmpl={'default': params['outtmpl']})
+    
+    def close(self):
+        pass
+
+
+class ProgressDispatchTest(unittest.TestCase):
+    
+    def setUp(self):
+        patcher = mock.patch.object(downloader.yt_dlp, 'YoutubeDL', FakeYoutubeDL)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.addCleanup(downloader.close_ydl_pool)
+    
+    def _get_ydl_in_worker(self, hook):
+        """Get a pooled instance on a fresh worker thread, like download_video does."""
+        result = {}
+        worker = threading.Thread(
+            target=lambda: result.update(ydl=downloader._get_ydl({'quiet': True}, '/tmp/a.%(ext)s', hook))
+        )
+        worker.start()
+        worker.join()
+        return result['ydl']
+    
+    def test_hook_called_from_another_thread(self):
+        hook = downloader.DownloadProgressHook('Video', mock.Mock(spec=logging.Logger))
+        ydl = self._get_ydl_in_worker(hook)
+        dispatch = ydl.params['progress_hooks'][0]
+        
+        # yt-dlp reports fragment progress from its own pool threads
+        events = [
+            {'status': 'downloading', 'downloaded_bytes': 50, 'total_bytes': 100},
+            {'status': 'finished'},
+        ]
+        fragment_thread = threading.Thread(target=lambda: [dispatch(d) for d in events])
+        fragment_thread.start()
+        fragment_thread.join()
+        
+        self.assertEqual(hook.status, 'finished')
+        messages = [call.args[0] for call in hook.logger.info.call_args_list]
+        self.assertIn("Downloading '%s': %.1f%% (%d/%d bytes)", messages)
+    
+    def test_hook_swapped_per_video(self):
+        first = downloader.DownloadProgressHook('First', mock.Mock(spec=logging.Logger))
+        second = downloader.DownloadProgressHook('Second', mock.Mock(spec=logging.Logger))
+        ydl = downloader._get_ydl({'quiet': True}, '/tmp/a.%(ext)s', first)
+        self.assertIs(downloader._get_ydl({'quiet': True}, '/tmp/b.%(ext)s', second), ydl)
+        
+        ydl.params['progress_hooks'][0]({'status': 'finished'})
+        
+        self.assertIsNone(first.status)
+        self.assertEqual(second.status, 'finished')
+        self.assertEqual(ydl.params['outtmpl']['default'], '/tmp/b.%(ext)s')
+
+
+if __name__ == '__main__':
+    unittest.main()